@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Import-time benchmark for the Matson Monitor integration.
+
+Imports each entry point Home Assistant loads in a fresh interpreter with
+-X importtime, after Home Assistant's own core modules, so only the cost
+the integration adds is counted. Requires homeassistant to be installed.
+
+    python benchmark_imports.py
+    python benchmark_imports.py --output imports.json
+    python benchmark_imports.py --baseline imports.json --max-regression 0.25
+
+Besides the time, it reports how many modules each entry point adds and
+the costliest of them. With --baseline the script exits non-zero if any
+entry point's median import time regressed by more than --max-regression.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+PACKAGE = "custom_components.matson_monitor"
+
+# What Home Assistant imports: the package itself (also imported first for
+# config flows), the config flow, and the platforms loaded on setup
+ENTRY_POINTS = {
+    "package": PACKAGE,
+    "config_flow": f"{PACKAGE}.config_flow",
+    "setup": f"{PACKAGE}.coordinator",
+    "sensor": f"{PACKAGE}.sensor",
+}
+
+# Already loaded by the time Home Assistant imports an integration
+PRELOADED = (
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.components.bluetooth",
+)
+
+
+def import_once(module: str) -> tuple[int, list[tuple[int, str]]]:
+    """Import module in a fresh interpreter, returns microseconds and (self us, name) per module."""
+    code = "; ".join(f"import {name}" for name in (*PRELOADED, module))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+
+    # importtime lines: "import time: self [us] | cumulative | name", in
+    # completion order, so everything after the last preloaded module
+    # was imported on behalf of the module under test
+    lines = [
+        line.split("|")
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    ]
+    names = [parts[2].strip() for parts in lines]
+    start = max(names.index(name) for name in PRELOADED) + 1
+    added = [(int(parts[0].split(":")[1]), parts[2].strip()) for parts in lines[start:]]
+    return sum(self_us for self_us, _ in added), added
+
+
+def measure(name: str, module: str, runs: int) -> dict[str, object]:
+    """Import a module runs times and summarise."""
+    timings = []
+    modules: list[tuple[int, str]] = []
+    for _ in range(runs):
+        total, modules = import_once(module)
+        timings.append(total / 1000)
+    costliest = [name for _, name in sorted(modules, reverse=True)[:3]]
+    result = {
+        "runs": runs,
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "modules": len(modules),
+        "costliest": costliest,
+    }
+    print(
+        f"{name:<12} {result['median_ms']:>8.1f} ms  min {result['min_ms']:>8.1f} ms"
+        f"  {result['modules']:>4} modules, costliest: {', '.join(costliest) or '-'}"
+    )
+    return result
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> bool:
+    """Print regressions against a baseline, returns False if any exceed the limit."""
+    ok = True
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["median_ms"]
+        change = (result["median_ms"] - before) / before if before else 0.0
+        flag = ""
+        if change > max_regression:
+            flag = "  REGRESSION"
+            ok = False
+        print(f"{name:<12} {before:>8.1f} -> {result['median_ms']:>8.1f} ms ({change:+.1%}){flag}")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per entry point")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare against a previous --output file")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="allowed median time increase")
+    args = parser.parse_args()
+
+    results = {
+        name: measure(name, module, args.runs) for name, module in ENTRY_POINTS.items()
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print()
+        if not compare(results, baseline, args.max_regression):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
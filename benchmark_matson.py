@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Offline benchmarks for the Matson Monitor coordinator.
+
+Runs the integration's coordinator against the simulated device in
+fake_matson.py, so no Bluetooth hardware is needed. Requires
+homeassistant and bleak-retry-connector to be installed.
+
+    python benchmark_matson.py
+    python benchmark_matson.py --output bench.json
+    python benchmark_matson.py --baseline bench.json --max-regression 0.25
+
+With --baseline the script exits non-zero if any benchmark's mean time
+regressed by more than --max-regression, for use in CI.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+import math
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from fake_matson import FakeBLEDevice, FakeMatsonClient, counter_frames
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.matson_monitor import (
+    coordinator as coordinator_module,
+    scheduler as scheduler_module,
+)
+from custom_components.matson_monitor.const import CONF_BINDING
+from custom_components.matson_monitor.coordinator import MatsonDataUpdateCoordinator
+from custom_components.matson_monitor.scheduler import MatsonScheduler
+
+NOTIFY_UUID = "0000ffe1-0000-1000-8000-00805f9b34fb"
+
+
+class Bench:
+    """Build coordinators wired to simulated clients."""
+
+    def __init__(self, hass: HomeAssistant, latency: float) -> None:
+        self.hass = hass
+        self.latency = latency
+        self.device = FakeBLEDevice()
+        self.client: FakeMatsonClient | None = None
+
+    async def _establish_connection(
+        self, client_class, device, name, disconnected_callback=None, **kwargs
+    ) -> FakeMatsonClient:
+        self.client = FakeMatsonClient(
+            self.device,
+            connect_latency=self.latency * 10,
+            read_latency=self.latency,
+            write_latency=self.latency,
+            notify_latency=self.latency,
+            disconnected_callback=disconnected_callback,
+        )
+        await self.client.connect()
+        return self.client
+
+    def coordinator(self) -> MatsonDataUpdateCoordinator:
+        entry = MagicMock()
+        # The simulated device does not notify on subscribe, keep the
+        # post-binding wait short so binding times the binding itself
+        entry.data = {CONF_BINDING: {"settle": 0.01}}
+        entry.options = {}
+        entry.entry_id = "benchmark"
+        entry.unique_id = self.device.address
+        return MatsonDataUpdateCoordinator(self.hass, entry, self.device, MatsonScheduler())
+
+
+async def measure(
+    name: str, iterations: int, func: Callable[[], Awaitable[Any]]
+) -> dict[str, float]:
+    """Time func over the given iterations and record its peak allocation."""
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    await func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        "iterations": iterations,
+        "mean_ms": statistics.fmean(timings),
+        # Nearest rank, so a handful of iterations reports the slowest
+        "p95_ms": sorted(timings)[math.ceil(len(timings) * 0.95) - 1],
+        "peak_kib": (peak - before) / 1024,
+    }
+    print(
+        f"{name:<24} {result['mean_ms']:>10.3f} ms  p95 {result['p95_ms']:>10.3f} ms"
+        f"  peak {result['peak_kib']:>8.1f} KiB  (n={iterations})"
+    )
+    return result
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    """Run every benchmark."""
+    hass = HomeAssistant(tempfile.mkdtemp())
+    hass.config_entries = MagicMock()
+    await dr.async_load(hass)
+    bench = Bench(hass, args.latency)
+    scale = args.iterations
+    results: dict[str, dict[str, float]] = {}
+
+    with (
+        # Measure the coordinator, not the gap kept between radio operations
+        patch.object(scheduler_module, "SCHEDULER_MIN_GAP", 0),
+        patch.object(coordinator_module, "establish_connection", bench._establish_connection),
+        patch.object(coordinator_module.bluetooth, "async_ble_device_from_address", return_value=None),
+        patch.object(coordinator_module.bluetooth, "async_last_service_info", return_value=None),
+    ):
+        coordinator = bench.coordinator()
+
+        # The simulated values never change, so without this the read plan
+        # drops every characteristic to the idle rate after a few reads and
+        # the read benchmarks would time reading nothing
+        async def read_data() -> None:
+            coordinator._unchanged_reads.clear()
+            await coordinator._read_data()
+
+        async def cold_update() -> None:
+            await coordinator._disconnect()
+            coordinator._unchanged_reads.clear()
+            await coordinator._async_update_data()
+
+        results["update_cold"] = await measure("update (cold connect)", 3 * scale, cold_update)
+
+        async def warm_update() -> None:
+            coordinator._unchanged_reads.clear()
+            await coordinator._async_update_data()
+
+        results["update_warm"] = await measure("update (connected)", 20 * scale, warm_update)
+        results["read_data"] = await measure("read_data", 20 * scale, read_data)
+        
+        async def pipelined_read() -> None:
+            coordinator._pipelined = True
+            await read_data()
+        
+        results["read_data_pipelined"] = await measure(
+            "read_data (pipelined)", 20 * scale, pipelined_read
+        )
+        results["binding"] = await measure("binding", 3 * scale, coordinator._perform_binding)
+
+        raw = dict(coordinator._raw_values)
+
+        async def parse() -> None:
+            coordinator._parse_data()
+
+        results["parse_data"] = await measure("parse_data", 1000 * scale, parse)
+
+        async def parse_fresh() -> None:
+            # New bytes objects, as after a read of every characteristic
+            coordinator._raw_values = {uuid: bytes(bytearray(value)) for uuid, value in raw.items()}
+            coordinator._parse_data()
+
+        results["parse_data_fresh"] = await measure("parse_data (all read)", 1000 * scale, parse_fresh)
+
+        frames = counter_frames(100)
+
+        async def notifications() -> None:
+            await bench.client.stream(NOTIFY_UUID, frames)
+
+        results["notify_100_frames"] = await measure("notify (100 frames)", 10 * scale, notifications)
+
+        await coordinator.async_shutdown()
+
+    return results
+
+
+def compare(results: dict, baseline: dict, max_regression: float) -> bool:
+    """Print regressions against a baseline, returns False if any exceed the limit."""
+    ok = True
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["mean_ms"]
+        change = (result["mean_ms"] - before) / before if before else 0.0
+        flag = ""
+        if change > max_regression:
+            flag = "  REGRESSION"
+            ok = False
+        print(f"{name:<24} {before:>10.3f} -> {result['mean_ms']:>10.3f} ms ({change:+.1%}){flag}")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated seconds per GATT operation")
+    parser.add_argument("--iterations", type=int, default=1, help="multiplier for iteration counts")
+    parser.add_argument("--output", help="write results as JSON")
+    parser.add_argument("--baseline", help="compare against a previous --output file")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="allowed mean time increase")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        print()
+        if not compare(results, baseline, args.max_regression):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,42 @@
 """The Matson Monitor integration."""
 from __future__ import annotations
 
+import importlib
 import logging
-from typing import Any
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN
-from .coordinator import MatsonDataUpdateCoordinator
+from .scheduler import async_get_scheduler
+from .storage import cache_store
+
+if TYPE_CHECKING:
+    from .coordinator import MatsonDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
 
+async def _async_import_coordinator(hass: HomeAssistant) -> ModuleType:
+    """Import the coordinator module off the event loop.
+
+    It pulls in bleak and bleak-retry-connector. Importing this package,
+    which config flows and Home Assistant's preloading also do, stays
+    cheap until a device is actually set up.
+    """
+    name = f"{__name__}.coordinator"
+    if (module := sys.modules.get(name)) is not None:
+        return module
+    return await hass.async_add_import_executor_job(importlib.import_module, name)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Matson Monitor from a config entry."""
     _LOGGER.debug("Setting up Matson Monitor integration")
@@ -25,29 +44,42 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     address = entry.unique_id
     assert address is not None
     
+    # May be None while Bluetooth is still starting, the coordinator looks
+    # the device up again when it connects
     ble_device = bluetooth.async_ble_device_from_address(
         hass, address.upper(), connectable=True
     )
     
-    if not ble_device:
-        raise ConfigEntryNotReady(
-            f"Could not find Matson Monitor device with address {address}"
-        )
-    
-    coordinator = MatsonDataUpdateCoordinator(hass, ble_device)
+    coordinator_module = await _async_import_coordinator(hass)
+    coordinator: MatsonDataUpdateCoordinator = coordinator_module.MatsonDataUpdateCoordinator(
+        hass, entry, ble_device, async_get_scheduler(hass)
+    )
     
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        raise ConfigEntryNotReady(f"Unable to connect to device: {err}") from err
+    # Entities are rebuilt from the keys and values cached by the last run
+    await coordinator.async_restore()
     
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entry.async_on_unload(coordinator.async_start_passive())
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    # Connect in the background so setup, and Home Assistant startup, does
+    # not wait on the radio. Entities show their restored values until data
+    # arrives and failures are retried by the normal poll.
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {address}"
+    )
+    
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options to the running coordinator."""
+    coordinator: MatsonDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_apply_options(entry.options)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
@@ -55,3 +87,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await coordinator.async_shutdown()
     
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the cached snapshot of a removed entry."""
+    await cache_store(hass, entry.entry_id).async_remove()
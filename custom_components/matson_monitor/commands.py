@@ -0,0 +1,84 @@
+"""Per-device command queue for Matson Monitor writes."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class Command:
+    """A pending write and the callers waiting for it."""
+
+    uuid: str
+    data: bytes
+    futures: list[asyncio.Future[None]] = field(default_factory=list)
+
+    def complete(self) -> None:
+        """Resolve every caller waiting on this write."""
+        for future in self.futures:
+            if not future.done():
+                future.set_result(None)
+
+    def fail(self, err: Exception) -> None:
+        """Fail every caller waiting on this write."""
+        for future in self.futures:
+            if not future.done():
+                future.set_exception(err)
+
+    def cancel(self) -> None:
+        """Cancel every caller waiting on this write."""
+        for future in self.futures:
+            future.cancel()
+
+
+class CommandQueue:
+    """Pending writes in arrival order.
+
+    A write with the same data as the latest one pending for its
+    characteristic joins that write, so the device receives it once and
+    every caller is resolved by it. Writes with different data are all
+    sent, in order, as each may be a separate command.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self._pending: deque[Command] = deque()
+        # Latest pending write per characteristic
+        self._latest: dict[str, Command] = {}
+        self.merged = 0
+
+    def __len__(self) -> int:
+        """Return the number of pending writes."""
+        return len(self._pending)
+
+    def put(self, uuid: str, data: bytes, loop: asyncio.AbstractEventLoop) -> asyncio.Future[None]:
+        """Queue a write, returns a future resolved once it has been sent."""
+        future: asyncio.Future[None] = loop.create_future()
+        command = self._latest.get(uuid)
+        if command is not None and command.data == data:
+            self.merged += 1
+        else:
+            command = self._latest[uuid] = Command(uuid, data)
+            self._pending.append(command)
+        command.futures.append(future)
+        return future
+
+    def pop(self) -> Command | None:
+        """Remove and return the oldest pending write."""
+        if not self._pending:
+            return None
+        command = self._pending.popleft()
+        if self._latest.get(command.uuid) is command:
+            del self._latest[command.uuid]
+        return command
+
+    def fail_all(self, err: Exception) -> None:
+        """Fail and drop every pending write."""
+        while (command := self.pop()) is not None:
+            command.fail(err)
+
+    def cancel_all(self) -> None:
+        """Cancel and drop every pending write."""
+        while (command := self.pop()) is not None:
+            command.cancel()
@@ -6,13 +6,31 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
-from homeassistant.config_entries import ConfigFlow
-from homeassistant.const import CONF_ADDRESS
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
+from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN
+from .const import (
+    CONF_COALESCE_WINDOW,
+    CONF_CONNECTION_POLICY,
+    CONF_IDLE_TIMEOUT,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_PIPELINED_READS,
+    CONNECTION_POLICY_ALWAYS,
+    CONNECTION_POLICY_IDLE,
+    CONNECTION_POLICY_PER_POLL,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_CONNECTION_POLICY,
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DOMAIN,
+)
+from .discovery import DiscoveredMonitor, async_get_discovery_index, async_onboard
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,7 +43,13 @@ class MatsonMonitorConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovery_info: BluetoothServiceInfoBleak | None = None
-        self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
+        self._discovered_devices: dict[str, DiscoveredMonitor] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return MatsonMonitorOptionsFlow(config_entry)
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -36,6 +60,7 @@ class MatsonMonitorConfigFlow(ConfigFlow, domain=DOMAIN):
             discovery_info.name, 
             discovery_info.address
         )
+        async_get_discovery_index(self.hass).async_update(discovery_info)
         await self.async_set_unique_id(discovery_info.address)
         self._abort_if_unique_id_configured()
         
@@ -49,30 +74,49 @@ class MatsonMonitorConfigFlow(ConfigFlow, domain=DOMAIN):
 
 
 
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> FlowResult:
+        """Add a device selected as part of a batch in the user step."""
+        address = discovery_info[CONF_ADDRESS]
+        await self.async_set_unique_id(address)
+        self._abort_if_unique_id_configured()
+        
+        return self.async_create_entry(
+            title=discovery_info[CONF_NAME] or address,
+            data={},
+        )
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Handle the user step to pick discovered device."""
+        """Handle the user step to pick one or more discovered devices."""
         if user_input is not None:
-            address = user_input[CONF_ADDRESS]
-            await self.async_set_unique_id(address, raise_on_progress=False)
+            devices = [
+                self._discovered_devices[address]
+                for address in user_input[CONF_ADDRESS]
+            ]
+            if not devices:
+                return self.async_abort(reason="no_devices_selected")
+            
+            first, *rest = devices
+            await self.async_set_unique_id(first.address, raise_on_progress=False)
             self._abort_if_unique_id_configured()
-            discovery_info = self._discovered_devices[address]
+            
+            if rest:
+                # The rest are added one by one in the background, staggered
+                # behind this entry, so their first connects do not collide
+                self.hass.async_create_task(async_onboard(self.hass, rest))
             
             return self.async_create_entry(
-                title=discovery_info.name or address,
+                title=first.name or first.address,
                 data={},
             )
         
-        current_addresses = self._async_current_ids()
-        discovered_devices = await bluetooth.async_discovered_service_info(self.hass)
-        
+        index = async_get_discovery_index(self.hass)
         self._discovered_devices = {
-            service_info.address: service_info
-            for service_info in discovered_devices
-            if service_info.address not in current_addresses
-            and service_info.name
-            and (service_info.name.startswith("Matson") or service_info.name.startswith("MATSON"))
+            device.address: device
+            for device in index.async_devices(exclude=self._async_current_ids())
         }
         
         if not self._discovered_devices:
@@ -82,12 +126,72 @@ class MatsonMonitorConfigFlow(ConfigFlow, domain=DOMAIN):
             step_id="user",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_ADDRESS): vol.In(
+                    vol.Required(CONF_ADDRESS): cv.multi_select(
                         {
-                            address: f"{service_info.name} ({address})"
-                            for address, service_info in self._discovered_devices.items()
+                            address: f"{device.name} ({address}, {device.rssi} dBm)"
+                            for address, device in self._discovered_devices.items()
                         }
                     )
                 }
             ),
         )
+
+
+class MatsonMonitorOptionsFlow(OptionsFlow):
+    """Handle Matson Monitor options."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage polling, notification coalescing, reads and the connection policy."""
+        errors: dict[str, str] = {}
+        
+        if user_input is not None:
+            if user_input[CONF_MIN_INTERVAL] > user_input[CONF_MAX_INTERVAL]:
+                errors["base"] = "min_above_max"
+            else:
+                return self.async_create_entry(title="", data=user_input)
+        
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MIN_INTERVAL,
+                        default=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Required(
+                        CONF_MAX_INTERVAL,
+                        default=options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Required(
+                        CONF_COALESCE_WINDOW,
+                        default=options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5000)),
+                    vol.Required(
+                        CONF_PIPELINED_READS,
+                        default=options.get(CONF_PIPELINED_READS, False),
+                    ): bool,
+                    vol.Required(
+                        CONF_CONNECTION_POLICY,
+                        default=options.get(CONF_CONNECTION_POLICY, DEFAULT_CONNECTION_POLICY),
+                    ): vol.In(
+                        {
+                            CONNECTION_POLICY_ALWAYS: "Always connected",
+                            CONNECTION_POLICY_PER_POLL: "Connect for each poll",
+                            CONNECTION_POLICY_IDLE: "Disconnect when idle",
+                        }
+                    ),
+                    vol.Required(
+                        CONF_IDLE_TIMEOUT,
+                        default=options.get(CONF_IDLE_TIMEOUT, DEFAULT_IDLE_TIMEOUT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                }
+            ),
+            errors=errors,
+        )
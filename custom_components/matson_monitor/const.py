@@ -2,6 +2,21 @@
 
 DOMAIN = "matson_monitor"
 
+# Config entry data
+CONF_BINDING = "binding"
+
+# Options
+CONF_MIN_INTERVAL = "min_interval"
+CONF_MAX_INTERVAL = "max_interval"
+CONF_COALESCE_WINDOW = "coalesce_window"
+CONF_PIPELINED_READS = "pipelined_reads"
+CONF_CONNECTION_POLICY = "connection_policy"
+CONF_IDLE_TIMEOUT = "idle_timeout"
+
+# Keys in hass.data[DOMAIN] that are not config entry ids
+DATA_SCHEDULER = "scheduler"
+DATA_DISCOVERY = "discovery"
+
 # BLE Service and Characteristic UUIDs (update these with actual Matson Monitor UUIDs)
 MATSON_SERVICE_UUID = "0000ffe0-0000-1000-8000-00805f9b34fb"
 MATSON_CHARACTERISTIC_READ_UUID = "0000ffe1-0000-1000-8000-00805f9b34fb"
@@ -16,5 +31,144 @@ MATSON_BINDING_COMMAND = b"\x01\x02"  # Placeholder - update with actual binding
 # Update interval
 UPDATE_INTERVAL = 30  # seconds
 
+# Adaptive polling: bounds (overridable in options) and how the interval
+# moves after each poll
+DEFAULT_MIN_INTERVAL = 10  # seconds
+DEFAULT_MAX_INTERVAL = 600  # seconds
+ADAPTIVE_SPEEDUP = 2  # divide while values are changing
+ADAPTIVE_RELAX = 1.25  # multiply while values are flat
+ADAPTIVE_BACKOFF = 2  # multiply after a failure or on a weak signal
+ADAPTIVE_WEAK_RSSI = -90  # dBm
+
+# Once notifications are flowing the poll only checks the link is still alive
+LIVENESS_INTERVAL = 300  # seconds
+
+# Connection management
+CONNECT_MAX_ATTEMPTS = 3  # attempts per connect, handled by bleak-retry-connector
+CONNECT_BACKOFF_BASE = 5  # seconds, doubled after each failed connect
+CONNECT_BACKOFF_MAX = 600  # seconds
+CONNECT_SLOT_BACKOFF = 60  # seconds to wait when no connection slot is free
+
+# Connection policy: hold the link, drop it after every poll, or drop it
+# once it has been idle for the idle timeout. Dropping frees the slot on
+# the adapter or proxy for other devices.
+CONNECTION_POLICY_ALWAYS = "always"
+CONNECTION_POLICY_PER_POLL = "per_poll"
+CONNECTION_POLICY_IDLE = "idle"
+DEFAULT_CONNECTION_POLICY = CONNECTION_POLICY_ALWAYS
+DEFAULT_IDLE_TIMEOUT = 60  # seconds
+
+# Scheduler: radio operations allowed at once per adapter or proxy, and the
+# minimum gap between consecutive operations on it
+SCHEDULER_ADAPTER_CONCURRENCY = 1
+SCHEDULER_MIN_GAP = 0.5  # seconds
+
+# Wait for the first notification after binding, in seconds. Starts at the
+# default and is learned per device from past sessions within these bounds.
+BINDING_SETTLE_DEFAULT = 1.0
+BINDING_SETTLE_MIN = 0.2
+BINDING_SETTLE_MAX = 5.0
+
+# Reads go back to back; a gap only opens while the device rejects reads
+READ_GAP_STEP = 0.05  # seconds
+READ_GAP_MAX = 0.5  # seconds
+
+# Pipelined reads (optional): reads kept in flight at once. Falls back to
+# serial reads for the session if the backend or proxy rejects overlap.
+READ_PIPELINE_DEPTH = 4
+
+# Read plan: characteristics unchanged for this many reads are only
+# re-read once READ_PLAN_IDLE_INTERVAL has passed since their last read
+READ_PLAN_IDLE_READS = 5
+READ_PLAN_IDLE_INTERVAL = 300  # seconds
+
+# Characteristics in these services never change during a session, so they
+# are read once per connection and cached
+GENERIC_ACCESS_SERVICE_UUID = "00001800-0000-1000-8000-00805f9b34fb"
+DEVICE_INFO_SERVICE_UUID = "0000180a-0000-1000-8000-00805f9b34fb"
+STATIC_SERVICE_UUIDS = frozenset({GENERIC_ACCESS_SERVICE_UUID, DEVICE_INFO_SERVICE_UUID})
+
+# Device Information characteristics surfaced through DeviceInfo
+DEVICE_INFO_CHARACTERISTICS = {
+    "00002a24-0000-1000-8000-00805f9b34fb": "model",
+    "00002a25-0000-1000-8000-00805f9b34fb": "serial_number",
+    "00002a26-0000-1000-8000-00805f9b34fb": "sw_version",
+    "00002a27-0000-1000-8000-00805f9b34fb": "hw_version",
+    "00002a29-0000-1000-8000-00805f9b34fb": "manufacturer",
+}
+
+# Frame schemas: characteristic UUID, or (UUID, frame type byte) for
+# characteristics that multiplex frames, -> fields as
+# (key, offset, struct format, scale, unit). Payloads with a schema are
+# decoded to numbers; anything else falls back to a string.
+FRAME_SCHEMAS = {
+    # Battery Level
+    "00002a19-0000-1000-8000-00805f9b34fb": (
+        ("battery_level", 0, "<B", 1, "%"),
+    ),
+    # Temperature
+    "00002a6e-0000-1000-8000-00805f9b34fb": (
+        ("temperature", 0, "<h", 0.01, "°C"),
+    ),
+    # Humidity
+    "00002a6f-0000-1000-8000-00805f9b34fb": (
+        ("humidity", 0, "<H", 0.01, "%"),
+    ),
+    # Matson frames on the notify characteristic go here once the protocol
+    # is known, for example:
+    # (MATSON_CHARACTERISTIC_NOTIFY_UUID, 0x01): (
+    #     ("voltage", 1, "<H", 0.01, "V"),
+    # ),
+}
+
+# Advertisement schemas, same field layout as FRAME_SCHEMAS. Keyed by service
+# data UUID or by manufacturer id as "manufacturer_<id>". When advertisements
+# carry every value that changes, the integration stops connecting.
+ADVERTISEMENT_SCHEMAS = {
+    # Fill in once the Matson advertisement format is known, for example:
+    # "manufacturer_1234": (
+    #     ("voltage", 0, "<H", 0.01, "V"),
+    # ),
+}
+
+# Notification framing per characteristic UUID, as FramingSpec fields
+# (start, length_offset, header, terminator, checksum, max_frame).
+# Characteristics not listed treat each notification as one frame.
+NOTIFY_FRAMING = {
+    # Fill in once the Matson stream format is known, for example a frame of
+    # 0xAA, length, payload, sum8 checksum:
+    # MATSON_CHARACTERISTIC_NOTIFY_UUID: {
+    #     "start": 0xAA, "length_offset": 1, "header": 2, "checksum": "sum8",
+    # },
+}
+
+# Notification frames arriving within this window are merged into one
+# coordinator update, except on characteristics carrying ALARM_KEYS, which
+# are pushed at once
+DEFAULT_COALESCE_WINDOW = 250  # milliseconds
+ALARM_KEYS: frozenset[str] = frozenset()
+
+# Notification history kept per characteristic
+NOTIFY_RING_CAPACITY = 32  # frames
+NOTIFY_MAX_FRAME = 512  # bytes
+
+# Sample history per numeric field: at most one sample per field per sample
+# interval, raw samples, then (period seconds, capacity) for each
+# downsampled resolution
+HISTORY_SAMPLE_INTERVAL = 30  # seconds
+HISTORY_RAW_CAPACITY = 120
+HISTORY_LEVELS = ((60, 60), (900, 96))
+
+# Last snapshot and key set are cached per entry so setup can rebuild
+# entities without reading the device; writes are batched by this delay
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30  # seconds
+
 # Device name patterns
 DEVICE_NAME_PREFIX = "Matson"
+
+# Discovery index: devices not heard from within this age are not offered
+DISCOVERY_MAX_AGE = 900  # seconds
+
+# Batched onboarding sets devices up one at a time with this gap between them
+ONBOARDING_STAGGER = 2.0  # seconds
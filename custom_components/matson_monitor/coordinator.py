@@ -1,136 +1,745 @@
 """DataUpdateCoordinator for Matson Monitor."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import timedelta
 import logging
+import random
+import time
 from typing import Any
 
 from bleak import BleakClient, BleakError
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
+from bleak_retry_connector import (
+    BleakClientWithServiceCache,
+    BleakOutOfConnectionSlotsError,
+    establish_connection,
+)
 
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
+    BluetoothChange,
+    BluetoothScanningMode,
+    BluetoothServiceInfoBleak,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, MATSON_SERVICE_UUID, MATSON_CHARACTERISTIC_READ_UUID, UPDATE_INTERVAL
+from .const import (
+    ADAPTIVE_BACKOFF,
+    ADAPTIVE_RELAX,
+    ADAPTIVE_SPEEDUP,
+    ADAPTIVE_WEAK_RSSI,
+    ALARM_KEYS,
+    BINDING_SETTLE_DEFAULT,
+    BINDING_SETTLE_MAX,
+    BINDING_SETTLE_MIN,
+    CONF_BINDING,
+    CONF_COALESCE_WINDOW,
+    CONF_CONNECTION_POLICY,
+    CONF_IDLE_TIMEOUT,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_PIPELINED_READS,
+    CONNECT_BACKOFF_BASE,
+    CONNECT_BACKOFF_MAX,
+    CONNECT_MAX_ATTEMPTS,
+    CONNECT_SLOT_BACKOFF,
+    CONNECTION_POLICY_ALWAYS,
+    CONNECTION_POLICY_IDLE,
+    CONNECTION_POLICY_PER_POLL,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_CONNECTION_POLICY,
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DEVICE_INFO_CHARACTERISTICS,
+    DOMAIN,
+    LIVENESS_INTERVAL,
+    NOTIFY_FRAMING,
+    READ_GAP_MAX,
+    READ_GAP_STEP,
+    READ_PIPELINE_DEPTH,
+    READ_PLAN_IDLE_INTERVAL,
+    READ_PLAN_IDLE_READS,
+    STATIC_SERVICE_UUIDS,
+    STORAGE_SAVE_DELAY,
+    UPDATE_INTERVAL,
+)
+
+from .commands import Command, CommandQueue
+from .decoder import ADVERTISEMENT_DECODER, DECODER, FrameKey
+from .framing import NotifyChannel
+from .history import DeviceHistory
+from .scheduler import MatsonScheduler
+from .snapshot import MatsonSnapshot
+from .storage import cache_store
 
 _LOGGER = logging.getLogger(__name__)
 
+# Characteristics whose frames carry alarm-class fields
+_ALARM_UUIDS = frozenset(
+    uuid for uuid, keys in DECODER.keys_by_uuid.items() if keys & ALARM_KEYS
+)
+
+# Snapshot keys that do not count as device values for adaptive polling
+_NON_VALUE_KEYS = frozenset({"rssi"})
+
+
+def _frame_key_label(frame_key: FrameKey) -> str:
+    """Return a raw value key as text, UUID/frame type for multiplexed frames."""
+    if isinstance(frame_key, tuple):
+        return f"{frame_key[0]}/{frame_key[1]:#04x}"
+    return frame_key
+
+
+class ConnectBackoffError(BleakError):
+    """Raised while a connect is held back by the backoff after a failure."""
+
+
+@dataclass
+class MatsonStats:
+    """Hot-path timings and counters for one device.
+
+    Durations are in milliseconds and describe the most recent occurrence.
+    """
+
+    connect_ms: float | None = None
+    bind_ms: float | None = None
+    read_cycle_ms: float | None = None
+    parse_ms: float | None = None
+    handle_read_ms: dict[int, float] = field(default_factory=dict)
+    bytes_read: int = 0
+    reads: int = 0
+    read_errors: int = 0
+    writes: int = 0
+    notifications: int = 0
+    connects: int = 0
+    reconnects: int = 0
+
+
+@dataclass
+class _ReadPlanEntry:
+    """A readable characteristic in the per-connection read plan."""
+
+    char: BleakGATTCharacteristic
+    static: bool = False
+
+
+class MatsonConnectionManager:
+    """Own the BLE link to a single Matson Monitor.
+
+    Only one connect is in flight per device, failed attempts back off
+    exponentially with jitter, and the GATT service table is cached by
+    bleak-retry-connector so reconnects skip service discovery.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        address: str,
+        ble_device: BLEDevice | None,
+        on_connected: Callable[[BleakClientWithServiceCache], Awaitable[None]],
+        on_disconnected: Callable[[], None],
+        stats: MatsonStats,
+    ) -> None:
+        """Initialize the connection manager."""
+        self._hass = hass
+        self._address = address
+        # Last known route to the device, None until an adapter has seen it
+        self._ble_device = ble_device
+        self._on_connected = on_connected
+        self._on_disconnected = on_disconnected
+        self._lock = asyncio.Lock()
+        self._client: BleakClientWithServiceCache | None = None
+        self._expected_disconnect = False
+        self._failures = 0
+        self._next_attempt = 0.0
+        self._stats = stats
+
+    @property
+    def client(self) -> BleakClientWithServiceCache | None:
+        """Return the connected client, if any."""
+        return self._client
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True if the link is up."""
+        return self._client is not None and self._client.is_connected
+
+    @property
+    def has_route(self) -> bool:
+        """Return True once a connectable adapter or proxy has seen the device."""
+        return self._ble_device is not None
 
-class MatsonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    async def async_connect(self) -> BleakClientWithServiceCache:
+        """Return a connected client, connecting if needed."""
+        async with self._lock:
+            if self._client is not None and self._client.is_connected:
+                return self._client
+            
+            wait = self._next_attempt - time.monotonic()
+            if wait > 0:
+                raise ConnectBackoffError(
+                    f"Waiting {wait:.0f}s before reconnecting to {self._address}"
+                )
+            
+            # Let HA pick the adapter or proxy with a free connection slot
+            ble_device = (
+                bluetooth.async_ble_device_from_address(
+                    self._hass, self._address, connectable=True
+                )
+                or self._ble_device
+            )
+            if ble_device is None:
+                # Not heard by a connectable adapter or proxy yet, common
+                # while Bluetooth is still starting up
+                raise BleakError(f"{self._address} has not been seen by any adapter or proxy")
+            self._ble_device = ble_device
+            _LOGGER.info("Connecting to %s", self._address)
+            
+            self._expected_disconnect = False
+            start = time.perf_counter()
+            try:
+                client = await establish_connection(
+                    BleakClientWithServiceCache,
+                    ble_device,
+                    ble_device.name or self._address,
+                    disconnected_callback=self._handle_disconnect,
+                    max_attempts=CONNECT_MAX_ATTEMPTS,
+                    use_services_cache=True,
+                    ble_device_callback=lambda: self._ble_device,
+                )
+            except BleakOutOfConnectionSlotsError:
+                self._schedule_retry(minimum=CONNECT_SLOT_BACKOFF)
+                raise
+            except (BleakError, asyncio.TimeoutError):
+                self._schedule_retry()
+                raise
+            
+            self._client = client
+            self._stats.connect_ms = (time.perf_counter() - start) * 1000
+            self._stats.connects += 1
+            _LOGGER.info(
+                "Connected to %s in %.0f ms", self._address, self._stats.connect_ms
+            )
+            try:
+                await self._on_connected(client)
+            except Exception:
+                self._schedule_retry()
+                await self._async_disconnect_locked()
+                raise
+            
+            if self._failures:
+                self._stats.reconnects += 1
+            self._failures = 0
+            self._next_attempt = 0.0
+            return client
+
+    def _schedule_retry(self, minimum: float = 0.0) -> None:
+        """Back off the next connect attempt with jittered exponential delay."""
+        self._failures += 1
+        delay = min(CONNECT_BACKOFF_MAX, CONNECT_BACKOFF_BASE * 2 ** (self._failures - 1))
+        delay = max(minimum, delay * random.uniform(0.5, 1.0))
+        self._next_attempt = time.monotonic() + delay
+        _LOGGER.debug(
+            "Connect to %s failed %d time(s), next attempt in %.1fs",
+            self._address,
+            self._failures,
+            delay,
+        )
+
+    async def async_disconnect(self) -> None:
+        """Disconnect from the device."""
+        async with self._lock:
+            await self._async_disconnect_locked()
+
+    async def _async_disconnect_locked(self) -> None:
+        """Disconnect while holding the connect lock."""
+        client, self._client = self._client, None
+        if client and client.is_connected:
+            self._expected_disconnect = True
+            await client.disconnect()
+            _LOGGER.debug("Disconnected from %s", self._address)
+
+    def _handle_disconnect(self, client: BleakClient) -> None:
+        """Handle the link dropping."""
+        if self._expected_disconnect:
+            _LOGGER.debug("Expected disconnect from %s", self._address)
+            return
+        
+        _LOGGER.warning("Unexpected disconnect from %s", self._address)
+        if client is self._client:
+            self._client = None
+        # Count an unexpected drop towards backoff so a flapping link cannot
+        # turn into a tight reconnect loop
+        self._schedule_retry()
+        self._on_disconnected()
+
+
+class MatsonDataUpdateCoordinator(DataUpdateCoordinator[MatsonSnapshot]):
     """Class to manage fetching Matson Monitor data."""
 
-    def __init__(self, hass: HomeAssistant, ble_device: BLEDevice) -> None:
-        """Initialize the coordinator."""
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        ble_device: BLEDevice | None,
+        scheduler: MatsonScheduler,
+    ) -> None:
+        """Initialize the coordinator.
+
+        ble_device may be None if no adapter has seen the device yet, it is
+        looked up again on every connect.
+        """
+        # Adaptive polling starts at UPDATE_INTERVAL, within the configured bounds
+        self._min_interval: float = entry.options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+        self._max_interval: float = entry.options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)
+        self._poll_interval: float = min(
+            self._max_interval, max(self._min_interval, UPDATE_INTERVAL)
+        )
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            update_interval=timedelta(seconds=self._poll_interval),
         )
-        self._ble_device = ble_device
-        self._client: BleakClient | None = None
-        self._expected_disconnect = False
-        self._is_bound = False
+        self._entry = entry
+        self._scheduler = scheduler
+        self._last_success: float | None = None
+        self._address = entry.unique_id.upper()
+        self.stats = MatsonStats()
+        self._connection = MatsonConnectionManager(
+            hass,
+            self._address,
+            ble_device,
+            self._async_setup_session,
+            self._async_handle_link_lost,
+            self.stats,
+        )
+        # Notification handles subscribed by the last successful binding
+        binding = entry.data.get(CONF_BINDING, {})
+        self._bound_handles: list[int] = (
+            list(binding.get("handles", [])) if binding.get("bound") else []
+        )
+        # Longest wait for the first notification after binding, learned per device
+        self._settle_timeout: float = binding.get("settle", BINDING_SETTLE_DEFAULT)
+        self._first_notification = asyncio.Event()
+        # Reassembly and frame history per notifying characteristic
+        self._channels: dict[str, NotifyChannel] = {}
+        self._pending_notifications: set[str] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._coalesce_window: float = (
+            entry.options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW) / 1000
+        )
+        # Gap between reads, only opened up if the device starts rejecting reads
+        self._read_gap = 0.0
+        # Pipelined reads as configured, and whether this session still uses them
+        self._pipeline_reads: bool = entry.options.get(CONF_PIPELINED_READS, False)
+        self._pipelined = self._pipeline_reads
+        # Latest raw value per characteristic UUID, or per (UUID, frame type)
+        # for multiplexed frames, fed by reads and notifications
+        self._raw_values: dict[FrameKey, bytes] = {}
+        self._last_notification: float | None = None
+        # Connection policy and, for the idle policy, the last radio activity
+        self._connection_policy: str = entry.options.get(
+            CONF_CONNECTION_POLICY, DEFAULT_CONNECTION_POLICY
+        )
+        self._idle_timeout: float = entry.options.get(CONF_IDLE_TIMEOUT, DEFAULT_IDLE_TIMEOUT)
+        self._last_activity = 0.0
+        self._idle_handle: asyncio.TimerHandle | None = None
+        # Serialises polls and writes on this device's link
+        self._link_lock = asyncio.Lock()
+        self._commands = CommandQueue()
+        self._command_task: asyncio.Task[None] | None = None
+        self._read_plan: dict[int, _ReadPlanEntry] | None = None
+        # Consecutive unchanged reads and monotonic time of the last read per
+        # characteristic UUID, kept across connections so the idle rate
+        # survives per-poll reconnects
+        self._unchanged_reads: dict[str, int] = {}
+        self._last_read: dict[str, float] = {}
+        # Decoded values of Generic Access and Device Information characteristics
+        self._static_values: dict[str, str] = {}
+        # Latest advertisement: RSSI and decoded advertised fields
+        self._rssi: int | None = getattr(ble_device, "rssi", None)
+        self._advertised: dict[str, Any] = {}
+        self._last_advertisement: float | None = None
+        # Keys decoded from dynamic (non-static) characteristics
+        self._polled_keys: set[str] = set()
+        # Last decode per raw value key as (raw value, fields or string),
+        # and the data_<uuid8> key of characteristics without a schema
+        self._decoded: dict[FrameKey, tuple[bytes, dict[str, Any] | str]] = {}
+        self._fallback_keys: dict[str, str] = {}
+        # Bounded history of numeric readings for derived statistics
+        self.history = DeviceHistory()
+        # Latest values, updated in place; becomes self.data after the first
+        # snapshot is built
+        self._snapshot = MatsonSnapshot()
+        # Keys whose value changed in the latest snapshot
+        self.changed_keys: set[str] = set()
+        # True once values have come from the device itself this run, not
+        # just from the cache or a replayed advertisement
+        self.device_read = False
+        # Every data key seen for this device and the last snapshot, cached
+        # across restarts so setup can rebuild entities without a read
+        self._store = cache_store(hass, entry.entry_id)
+        self._store_dirty = False
+        self.known_keys: set[str] = set()
+        # Keys seen for the first time in the latest snapshot
+        self.new_keys: set[str] = set()
+        self.restored_data: dict[str, Any] = {}
+        # Device Information values, cached too so entities can register the
+        # device with them before the first connection
+        self.device_info_fields: dict[str, str] = {}
+
+    @property
+    def _client(self) -> BleakClientWithServiceCache | None:
+        """Return the connected client, if any."""
+        return self._connection.client
+
+    @property
+    def push_active(self) -> bool:
+        """Return True if notifications are currently keeping data fresh."""
+        return (
+            self._last_notification is not None
+            and time.monotonic() - self._last_notification < LIVENESS_INTERVAL
+        )
+
+    def _set_push_mode(self, active: bool) -> None:
+        """Switch between full polling and the slow liveness check."""
+        interval = timedelta(seconds=LIVENESS_INTERVAL if active else self._poll_interval)
+        if self.update_interval != interval:
+            _LOGGER.debug(
+                "%s %s push mode, polling every %s",
+                self._address,
+                "entering" if active else "leaving",
+                interval,
+            )
+            self.update_interval = interval
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed options without reconnecting."""
+        self._min_interval = options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL)
+        self._max_interval = options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL)
+        self._poll_interval = min(self._max_interval, max(self._min_interval, self._poll_interval))
+        self._set_push_mode(self.push_active)
+        self._coalesce_window = (
+            options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW) / 1000
+        )
+        self._pipeline_reads = options.get(CONF_PIPELINED_READS, False)
+        self._pipelined = self._pipeline_reads
+        self._connection_policy = options.get(CONF_CONNECTION_POLICY, DEFAULT_CONNECTION_POLICY)
+        self._idle_timeout = options.get(CONF_IDLE_TIMEOUT, DEFAULT_IDLE_TIMEOUT)
+        if self._connection.is_connected:
+            self._touch()
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    def _adapt_interval(self, failed: bool, first_read: bool = False) -> None:
+        """Tune the poll interval to value volatility and link quality.
+
+        Polls speed up while values are changing, relax while they are flat,
+        and back off when reads fail or the signal is weak, always within
+        the configured bounds.
+        """
+        interval = self._poll_interval
+        weak = self._rssi is not None and self._rssi < ADAPTIVE_WEAK_RSSI
+        if failed or weak:
+            interval *= ADAPTIVE_BACKOFF
+        elif first_read:
+            # First read from the device, every key looks changed
+            pass
+        elif any(key not in _NON_VALUE_KEYS for key in self.changed_keys):
+            interval /= ADAPTIVE_SPEEDUP
+        else:
+            interval *= ADAPTIVE_RELAX
+        self._poll_interval = min(self._max_interval, max(self._min_interval, interval))
+        self._set_push_mode(self.push_active)
+
+    async def _async_update_data(self) -> MatsonSnapshot:
         """Fetch data from the Matson Monitor."""
         try:
-            if self._client is None or not self._client.is_connected:
-                await self._connect()
+            if self._advertisements_cover_data:
+                # Everything that changes is advertised, so no connection is needed
+                if self._connection.is_connected:
+                    async with self._radio():
+                        if self._connection.is_connected:
+                            await self._disconnect()
+                self.device_read = True
+                return self._build_snapshot()
+            
+            if self.push_active and self._connection.is_connected:
+                # Notifications keep the values current, this poll only
+                # confirms the link is alive and refreshes RSSI.
+                return self._build_snapshot()
             
-            data = await self._read_data()
+            if (
+                self._read_plan is not None
+                and not self._connection.is_connected
+                and self._connection_policy != CONNECTION_POLICY_ALWAYS
+                and not self._due_handles()
+            ):
+                # Every characteristic is idle and none is due for a read,
+                # so there is no reason to connect
+                self._adapt_interval(failed=False)
+                return self._build_snapshot()
+            
+            async with self._radio():
+                if self._client is None or not self._client.is_connected:
+                    await self._connect()
+                
+                if self.push_active:
+                    return self._build_snapshot()
+                
+                first_read = not self.device_read
+                data = await self._read_data()
+                await self._async_finish_radio_work()
+            
+            self._last_success = time.monotonic()
+            self._adapt_interval(failed=False, first_read=first_read)
             return data
             
+        except ConnectBackoffError as err:
+            # The failure that started the backoff was already reported
+            # and counted, waiting it out is not another one
+            _LOGGER.debug("%s", err)
+            raise UpdateFailed(str(err)) from err
         except (BleakError, Exception) as err:
             _LOGGER.error("Error communicating with device: %s", err)
+            self._adapt_interval(failed=True)
             if self._client and self._client.is_connected:
-                await self._disconnect()
+                async with self._radio():
+                    if self._client and self._client.is_connected:
+                        await self._disconnect()
             raise UpdateFailed(f"Error communicating with device: {err}") from err
 
-    async def _connect(self) -> None:
-        """Connect to the device."""
-        _LOGGER.info("Connecting to %s", self._ble_device.address)
-        
-        self._expected_disconnect = False
-        self._client = BleakClient(
-            self._ble_device,
-            disconnected_callback=self._on_disconnect,
-            timeout=30.0,
+    @property
+    def _advertisements_cover_data(self) -> bool:
+        """Return True if recent advertisements carry every dynamic value."""
+        return (
+            self._last_advertisement is not None
+            and time.monotonic() - self._last_advertisement < UPDATE_INTERVAL
+            and bool(self._polled_keys)
+            and self._polled_keys <= self._advertised.keys()
+        )
+
+    @callback
+    def async_start_passive(self) -> CALLBACK_TYPE:
+        """Listen for advertisements from the device, returns the unsubscribe."""
+        return bluetooth.async_register_callback(
+            self.hass,
+            self._async_handle_advertisement,
+            BluetoothCallbackMatcher(address=self._address, connectable=False),
+            BluetoothScanningMode.PASSIVE,
         )
+
+    @callback
+    def _async_handle_advertisement(
+        self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        """Decode an advertisement and update entities without connecting."""
+        self._rssi = service_info.rssi
+        self._last_advertisement = time.monotonic()
         
-        await self._client.connect()
-        _LOGGER.info("Connected to %s", self._ble_device.address)
+        for manufacturer_id, payload in service_info.manufacturer_data.items():
+            if fields := ADVERTISEMENT_DECODER.decode(
+                f"manufacturer_{manufacturer_id}", payload
+            ):
+                self._advertised.update(fields)
+        for uuid, payload in service_info.service_data.items():
+            if fields := ADVERTISEMENT_DECODER.decode(uuid, payload):
+                self._advertised.update(fields)
         
-        # Wait for connection to stabilize
-        import asyncio
-        await asyncio.sleep(1)
+        # Update listeners directly, async_set_updated_data would keep
+        # pushing back the scheduled poll on every advertisement
+        self.data = self._build_snapshot()
+        if self.changed_keys:
+            self.async_update_listeners()
         
-        # Verify still connected
-        if not self._client.is_connected:
+        if service_info.connectable and not self._connection.has_route:
+            # First connectable sighting, e.g. the device was not heard yet
+            # when setup ran at startup; connect now instead of at the next poll
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @property
+    def _adapter(self) -> str:
+        """Return the adapter or proxy currently serving this device."""
+        service_info = bluetooth.async_last_service_info(
+            self.hass, self._address, connectable=True
+        )
+        return service_info.source if service_info else "default"
+
+    async def _connect(self) -> None:
+        """Connect to the device."""
+        await self._connection.async_connect()
+
+    async def _async_setup_session(self, client: BleakClientWithServiceCache) -> None:
+        """Prepare a freshly connected client, called once per connection."""
+        self._read_plan = None
+        self._pipelined = self._pipeline_reads
+        self._first_notification.clear()
+        
+        # establish_connection returns once services are resolved, so there
+        # is no settle delay; just confirm the link and service table
+        if not client.is_connected:
             raise BleakError("Device disconnected immediately after connection")
+        if next(iter(client.services), None) is None:
+            raise BleakError("No services resolved after connection")
         
-        # Perform binding if not already bound
-        if not self._is_bound:
-            _LOGGER.info("Performing binding for %s", self._ble_device.address)
+        # Subscriptions do not survive a disconnect, so every new connection
+        # either replays the recorded binding or performs a full one
+        start = time.perf_counter()
+        if not self._bound_handles or not await self._async_replay_binding(client):
+            _LOGGER.info("Performing binding for %s", self._address)
             await self._perform_binding()
-            self._is_bound = True
-            _LOGGER.info("Binding completed for %s", self._ble_device.address)
+            _LOGGER.info("Binding completed for %s", self._address)
+        self.stats.bind_ms = (time.perf_counter() - start) * 1000
 
     async def _disconnect(self) -> None:
         """Disconnect from the device."""
-        if self._client and self._client.is_connected:
-            self._expected_disconnect = True
-            await self._client.disconnect()
-            _LOGGER.debug("Disconnected from %s", self._ble_device.address)
+        await self._connection.async_disconnect()
+        self._on_disconnect()
 
     @callback
-    def _on_disconnect(self, client: BleakClient) -> None:
-        """Handle device disconnect."""
-        if self._expected_disconnect:
-            _LOGGER.debug("Expected disconnect from %s", self._ble_device.address)
+    def _on_disconnect(self) -> None:
+        """Fall back to polling once the link is gone, expected or not."""
+        self._last_notification = None
+        self._set_push_mode(False)
+
+    @callback
+    def _async_handle_link_lost(self) -> None:
+        """Poll at the normal interval again after the link dropped unexpectedly."""
+        self._on_disconnect()
+        if self._unsub_refresh is not None:
+            # Setting update_interval does not move a refresh that is already
+            # scheduled, which in push mode is up to LIVENESS_INTERVAL away
+            self._schedule_refresh()
+
+    async def _async_finish_radio_work(self) -> None:
+        """Apply the connection policy once a poll or write is done with the link."""
+        if self._connection_policy == CONNECTION_POLICY_PER_POLL:
+            await self._disconnect()
+        else:
+            self._touch()
+
+    @callback
+    def _touch(self) -> None:
+        """Record radio activity and arm the idle check if the policy uses one."""
+        self._last_activity = time.monotonic()
+        if self._connection_policy == CONNECTION_POLICY_IDLE and self._idle_handle is None:
+            self._idle_handle = self.hass.loop.call_later(
+                self._idle_timeout, self._async_check_idle
+            )
+
+    @callback
+    def _async_check_idle(self) -> None:
+        """Release the link once nothing has used it for the idle timeout."""
+        self._idle_handle = None
+        if self._connection_policy != CONNECTION_POLICY_IDLE or not self._connection.is_connected:
             return
-        
-        _LOGGER.warning("Unexpected disconnect from %s", self._ble_device.address)
-        self._client = None
+        remaining = self._last_activity + self._idle_timeout - time.monotonic()
+        if remaining > 0:
+            # Used since the check was armed, look again when it would expire
+            self._idle_handle = self.hass.loop.call_later(remaining, self._async_check_idle)
+            return
+        self.hass.async_create_task(self._async_release_idle())
 
-    async def _read_data(self) -> dict[str, Any]:
+    async def _async_release_idle(self) -> None:
+        """Disconnect an idle link without cutting into a poll or write."""
+        async with self._radio():
+            if (
+                self._connection.is_connected
+                and time.monotonic() - self._last_activity >= self._idle_timeout
+            ):
+                _LOGGER.debug("Releasing idle link to %s", self._address)
+                await self._disconnect()
+
+    async def _read_data(self) -> MatsonSnapshot:
         """Read data from the Matson Monitor."""
-        import asyncio
-        
         if not self._client or not self._client.is_connected:
             _LOGGER.warning("Not connected to device, attempting reconnection...")
             raise UpdateFailed("Not connected to device")
         
-        data: dict[str, Any] = {}
+        data: dict[FrameKey, bytes] = {}
         
         try:
-            # Read all services and characteristics
-            services = self._client.services
+            # The read plan is built once per connection from the discovered services
+            if self._read_plan is None:
+                self._read_plan = self._build_read_plan()
+            static_handles: list[int] = []
+            errors = 0
+            cycle_start = time.perf_counter()
+            pending = self._due_handles()
             
-            for service in services:
-                _LOGGER.debug("Service: %s", service.uuid)
-                
-                for char in service.characteristics:
-                    _LOGGER.debug("  Characteristic: %s (Properties: %s)", 
-                                char.uuid, char.properties)
+            # Handles whose pipelined read failed, retried serially below
+            retried: set[int] = set()
+            if self._pipelined and len(pending) > 1:
+                results = await self._read_pipelined(pending)
+                pending = []
+                for handle, result in results.items():
+                    if isinstance(result, Exception):
+                        pending.append(handle)
+                    else:
+                        self._record_read(handle, result, data, static_handles)
+                retried.update(pending)
+            
+            recovered = 0
+            for handle in pending:
+                try:
+                    # Check connection before each read
+                    if not self._client.is_connected:
+                        _LOGGER.warning("Lost connection during data read")
+                        raise UpdateFailed("Connection lost during read")
                     
-                    if "read" in char.properties:
-                        try:
-                            # Check connection before each read
-                            if not self._client.is_connected:
-                                _LOGGER.warning("Lost connection during data read")
-                                raise UpdateFailed("Connection lost during read")
-                            
-                            value = await self._client.read_gatt_char(char.uuid)
-                            data[char.uuid] = value
-                            _LOGGER.debug("    Read value: %s", value.hex())
-                            await asyncio.sleep(0.1)  # Small delay between reads
-                        except Exception as err:
-                            _LOGGER.debug("    Could not read %s: %s", char.uuid, err)
+                    value = await self._read_handle(handle)
+                    self._record_read(handle, value, data, static_handles)
+                    if handle in retried:
+                        recovered += 1
+                    if self._read_gap:
+                        await asyncio.sleep(self._read_gap)
+                except UpdateFailed:
+                    raise
+                except Exception as err:
+                    self.stats.read_errors += 1
+                    errors += 1
+                    _LOGGER.debug("Could not read handle %d: %s", handle, err)
+            
+            if recovered:
+                # Reads that failed overlapped went through one at a time, so
+                # the backend rejects overlap: stay serial for this session.
+                # Reads that fail either way are plain read errors.
+                _LOGGER.debug(
+                    "%s rejected %d pipelined read(s), reading serially",
+                    self._address,
+                    recovered,
+                )
+                self._pipelined = False
+            
+            # Open the gap between reads while the device rejects them and
+            # close it again once a cycle goes clean
+            if errors:
+                self._read_gap = min(READ_GAP_MAX, self._read_gap + READ_GAP_STEP)
+            else:
+                self._read_gap /= 2
+                if self._read_gap < READ_GAP_STEP / 4:
+                    self._read_gap = 0.0
+            
+            self.stats.read_cycle_ms = (time.perf_counter() - cycle_start) * 1000
+            for handle in static_handles:
+                del self._read_plan[handle]
+            if static_handles:
+                self._async_update_device_info()
             
             # Parse the data based on Matson Monitor protocol
-            parsed_data = self._parse_data(data)
+            self._raw_values.update(data)
+            self.device_read = True
+            parsed_data = self._build_snapshot()
             
             return parsed_data
             
@@ -138,49 +747,288 @@ class MatsonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.error("Error reading data: %s", err)
             raise UpdateFailed(f"Error reading data: {err}") from err
 
-    def _parse_data(self, raw_data: dict[str, bytes]) -> dict[str, Any]:
-        """Parse raw data from the device."""
-        parsed: dict[str, Any] = {
-            "raw_data": {uuid: value.hex() for uuid, value in raw_data.items()},
-            "rssi": self._ble_device.rssi if hasattr(self._ble_device, 'rssi') else None,
+    async def _read_handle(self, handle: int) -> bytes:
+        """Read one characteristic of the plan and time it."""
+        start = time.perf_counter()
+        value = bytes(await self._client.read_gatt_char(self._read_plan[handle].char))
+        self.stats.handle_read_ms[handle] = (time.perf_counter() - start) * 1000
+        self.stats.reads += 1
+        self.stats.bytes_read += len(value)
+        return value
+
+    async def _read_pipelined(self, handles: list[int]) -> dict[int, bytes | Exception]:
+        """Read with up to READ_PIPELINE_DEPTH reads in flight.
+
+        A cycle takes about one round trip per batch of READ_PIPELINE_DEPTH
+        reads instead of one per characteristic.
+        """
+        semaphore = asyncio.Semaphore(READ_PIPELINE_DEPTH)
+        
+        async def read(handle: int) -> bytes:
+            async with semaphore:
+                return await self._read_handle(handle)
+        
+        results = await asyncio.gather(*(read(handle) for handle in handles), return_exceptions=True)
+        return dict(zip(handles, results))
+
+    def _record_read(
+        self, handle: int, value: bytes, data: dict[FrameKey, bytes], static_handles: list[int]
+    ) -> None:
+        """Track a read value's stability and cache static characteristics."""
+        entry = self._read_plan[handle]
+        uuid = entry.char.uuid
+        frame_key = DECODER.frame_key(uuid, value)
+        if self._raw_values.get(frame_key) == value:
+            self._unchanged_reads[uuid] = self._unchanged_reads.get(uuid, 0) + 1
+        else:
+            self._unchanged_reads[uuid] = 0
+        self._last_read[uuid] = time.monotonic()
+        data[frame_key] = value
+        _LOGGER.debug("Read %s (handle %d): %s", uuid, handle, value.hex())
+        if entry.static:
+            # Static values are decoded once and not read again, even after
+            # reconnecting. Anything else that sits flat stays in the plan
+            # at the idle rate.
+            self._static_values[uuid] = self._decode_value(value)
+            static_handles.append(handle)
+
+    def _build_read_plan(self) -> dict[int, _ReadPlanEntry]:
+        """Build the per-connection read plan, keyed by characteristic handle.
+
+        Static characteristics already read on an earlier connection are
+        left out.
+        """
+        plan: dict[int, _ReadPlanEntry] = {}
+        for service in self._client.services:
+            static = service.uuid in STATIC_SERVICE_UUIDS
+            for char in service.characteristics:
+                if "read" not in char.properties:
+                    continue
+                if static and char.uuid in self._static_values:
+                    continue
+                plan[char.handle] = _ReadPlanEntry(char, static=static)
+        _LOGGER.debug(
+            "Read plan for %s: %d characteristics", self._address, len(plan)
+        )
+        return plan
+
+    def _due_handles(self) -> list[int]:
+        """Return the plan handles due for a read now.
+
+        Characteristics that have not changed for READ_PLAN_IDLE_READS
+        reads are only re-read once READ_PLAN_IDLE_INTERVAL has passed,
+        however long or short the poll interval is.
+        """
+        now = time.monotonic()
+        return [
+            handle
+            for handle, entry in self._read_plan.items()
+            if self._unchanged_reads.get(entry.char.uuid, 0) < READ_PLAN_IDLE_READS
+            or now - self._last_read.get(entry.char.uuid, 0.0) >= READ_PLAN_IDLE_INTERVAL
+        ]
+
+    def _build_snapshot(self) -> MatsonSnapshot:
+        """Parse the cached raw values into the snapshot and record which keys changed.
+
+        changed_keys only covers this snapshot, so entities compare against
+        the value they last wrote rather than relying on it.
+        """
+        start = time.perf_counter()
+        self.changed_keys = self._parse_data()
+        self.stats.parse_ms = (time.perf_counter() - start) * 1000
+        self.history.record(time.time(), self._snapshot)
+        
+        new_keys = self.new_keys = self.changed_keys - self.known_keys - _NON_VALUE_KEYS
+        self.known_keys.update(new_keys)
+        if new_keys or self.changed_keys - _NON_VALUE_KEYS:
+            # RSSI alone does not trigger a write
+            self._async_schedule_save()
+        return self._snapshot
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a write of the cache.
+
+        async_delay_save restarts its timer on each call, so only the first
+        change since the last write schedules it.
+        """
+        if not self._store_dirty:
+            self._store_dirty = True
+            self._store.async_delay_save(self._cache_data, STORAGE_SAVE_DELAY)
+
+    def value_slot(self, key: str) -> int:
+        """Return the snapshot slot an entity reads the key's value from."""
+        return self._snapshot.slot(key)
+
+    async def async_restore(self) -> None:
+        """Load the key set and snapshot cached by a previous run."""
+        if (cached := await self._store.async_load()) is None:
+            return
+        self.known_keys.update(cached.get("keys", ()))
+        self.restored_data = cached.get("data", {})
+        self.device_info_fields = cached.get("device_info", {})
+
+    @callback
+    def _cache_data(self) -> dict[str, Any]:
+        """Return what the store writes, called when the delayed save runs."""
+        self._store_dirty = False
+        data = self.data or self.restored_data
+        return {
+            "keys": sorted(self.known_keys),
+            "data": dict(data),
+            "device_info": self.device_info_fields,
         }
+
+    def _parse_data(self) -> set[str]:
+        """Parse the cached raw values into the snapshot, returns the changed keys."""
+        snapshot = self._snapshot
+        snapshot.begin()
+        snapshot.put("rssi", self._rssi)
         
-        # Add parsing logic specific to Matson Monitor data format
-        # This is a placeholder - update with actual protocol parsing
-        for uuid, value in raw_data.items():
-            if len(value) > 0:
-                # Example: Parse as integers, strings, etc. based on the protocol
-                try:
-                    # Try to decode as UTF-8 string
-                    parsed[f"data_{uuid.split('-')[0]}"] = value.decode('utf-8').strip('\x00')
-                except UnicodeDecodeError:
-                    # If not a string, store as hex
-                    parsed[f"data_{uuid.split('-')[0]}"] = value.hex()
+        for frame_key, value in self._raw_values.items():
+            if not value:
+                continue
+            uuid = frame_key[0] if isinstance(frame_key, tuple) else frame_key
+            # Decoding is skipped while a characteristic's raw value is the
+            # same object as last time, i.e. it was not read or notified since
+            cached = self._decoded.get(frame_key)
+            if cached is not None and cached[0] is value:
+                decoded = cached[1]
+            else:
+                decoded = DECODER.decode(uuid, value)
+                if decoded is None:
+                    decoded = self._decode_value(value)
+                self._decoded[frame_key] = (value, decoded)
+            
+            static = uuid in self._static_values
+            if isinstance(decoded, dict):
+                for key, field_value in decoded.items():
+                    snapshot.put(key, field_value)
+                if not static:
+                    self._polled_keys.update(decoded)
+                continue
+            
+            if (key := self._fallback_keys.get(uuid)) is None:
+                key = self._fallback_keys[uuid] = f"data_{uuid.split('-')[0]}"
+            snapshot.put(key, decoded)
+            if not static:
+                self._polled_keys.add(key)
         
-        return parsed
+        # Advertised values are the freshest, so they win over GATT reads
+        for key, value in self._advertised.items():
+            snapshot.put(key, value)
+        return snapshot.finish()
+
+    @staticmethod
+    def _decode_value(value: bytes) -> str:
+        """Decode a characteristic value as a string, falling back to hex."""
+        # Example: Parse as integers, strings, etc. based on the protocol
+        try:
+            # Try to decode as UTF-8 string
+            return value.decode('utf-8').strip('\x00')
+        except UnicodeDecodeError:
+            # If not a string, store as hex
+            return value.hex()
+
+    @callback
+    def _async_update_device_info(self) -> None:
+        """Push newly read Device Information values to the device registry.
+
+        Setup does not wait for a connection, so entities register the
+        device with whatever was cached and the registry is updated here
+        once the values are read.
+        """
+        fields = {
+            field: self._static_values[uuid]
+            for uuid, field in DEVICE_INFO_CHARACTERISTICS.items()
+            if self._static_values.get(uuid)
+        }
+        if not fields or fields == self.device_info_fields:
+            return
+        self.device_info_fields = fields
+        registry = dr.async_get(self.hass)
+        if device := registry.async_get_device(identifiers={(DOMAIN, self._entry.unique_id)}):
+            registry.async_update_device(device.id, **fields)
+        self._async_schedule_save()
+
+    @asynccontextmanager
+    async def _radio(self) -> AsyncIterator[None]:
+        """Hold this device's link and a radio slot on its adapter.
+
+        Polls, queued writes and idle releases of one device never overlap,
+        whatever the adapter concurrency.
+        """
+        async with self._link_lock, self._scheduler.async_radio_slot(
+            self._adapter, self._address, self._last_success
+        ):
+            yield
+
+    @callback
+    def async_enqueue_write(self, characteristic_uuid: str, data: bytes) -> asyncio.Future[None]:
+        """Queue a write, returns a future resolved once it has been sent.
+
+        A write identical to the latest one pending for the characteristic
+        is sent once for both callers; different data is always sent.
+        """
+        future = self._commands.put(characteristic_uuid, bytes(data), self.hass.loop)
+        if self._command_task is None:
+            self._command_task = self.hass.async_create_task(self._async_drain_commands())
+        return future
 
     async def async_write_data(self, characteristic_uuid: str, data: bytes) -> None:
-        """Write data to a characteristic."""
-        if not self._client or not self._client.is_connected:
-            await self._connect()
-        
+        """Write data to a characteristic through the command queue."""
+        await self.async_enqueue_write(characteristic_uuid, data)
+
+    async def _async_drain_commands(self) -> None:
+        """Send every queued write in one burst on one connection."""
         try:
-            await self._client.write_gatt_char(characteristic_uuid, data)
-            _LOGGER.debug("Wrote data to %s: %s", characteristic_uuid, data.hex())
+            async with self._radio():
+                if not self._connection.is_connected:
+                    await self._connect()
+                # Writes queued while this runs go out in the same burst
+                while (command := self._commands.pop()) is not None:
+                    try:
+                        await self._write_command(command)
+                    except asyncio.CancelledError:
+                        command.cancel()
+                        raise
+                    except Exception as err:
+                        _LOGGER.error("Error writing data: %s", err)
+                        command.fail(err)
+                        if not self._connection.is_connected:
+                            raise
+                    else:
+                        command.complete()
+                await self._async_finish_radio_work()
         except Exception as err:
-            _LOGGER.error("Error writing data: %s", err)
-            raise
+            self._commands.fail_all(err)
+        finally:
+            self._command_task = None
+            if self._commands:
+                # Queued after the burst finished
+                self._command_task = self.hass.async_create_task(self._async_drain_commands())
+
+    async def _write_command(self, command: Command) -> None:
+        """Write one command, without response if the characteristic allows it."""
+        if self._client is None or not self._client.is_connected:
+            # The link can drop between commands of a burst
+            raise BleakError(f"Not connected, cannot write to {command.uuid}")
+        char = self._client.services.get_characteristic(command.uuid)
+        response = char is None or "write-without-response" not in char.properties
+        await self._client.write_gatt_char(char or command.uuid, command.data, response=response)
+        self.stats.writes += 1
+        _LOGGER.debug(
+            "Wrote data to %s%s: %s",
+            command.uuid,
+            "" if response else " without response",
+            command.data.hex(),
+        )
 
     async def _perform_binding(self) -> None:
         """Perform binding with the Matson Monitor device."""
-        import asyncio
-        
         _LOGGER.info("Starting binding procedure with Matson Monitor")
         
         try:
-            # Wait a moment for device to be ready
-            await asyncio.sleep(0.5)
-            
             # Check if still connected
             if not self._client.is_connected:
                 _LOGGER.error("Device disconnected before binding could start")
@@ -193,24 +1041,26 @@ class MatsonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER.info("Found %d services", len(service_list))
             
             # Enable notifications on notify-capable characteristics
-            notifications_enabled = 0
+            subscribed: list[int] = []
             for service in service_list:
                 _LOGGER.debug("Service: %s", service.uuid)
                 for char in service.characteristics:
                     if "notify" in char.properties or "indicate" in char.properties:
                         _LOGGER.info("Enabling notifications on %s", char.uuid)
                         try:
-                            await self._client.start_notify(char.uuid, self._notification_handler)
-                            await asyncio.sleep(0.2)  # Small delay between notifications
-                            notifications_enabled += 1
+                            # start_notify returns once the CCCD write is acknowledged
+                            await self._client.start_notify(char, self._notification_handler)
+                            subscribed.append(char.handle)
                             _LOGGER.info("✓ Notifications enabled on %s", char.uuid)
                         except Exception as err:
                             _LOGGER.warning("Could not enable notifications on %s: %s", char.uuid, err)
             
-            _LOGGER.info("Enabled notifications on %d characteristics", notifications_enabled)
+            _LOGGER.info("Enabled notifications on %d characteristics", len(subscribed))
             
-            # Give device time to process binding
-            await asyncio.sleep(1)
+            # Give device time to process binding: wait for its first
+            # notification, bounded by what past sessions needed
+            if subscribed:
+                await self._async_wait_first_notification()
             
             # Verify still connected after binding
             if not self._client.is_connected:
@@ -218,18 +1068,193 @@ class MatsonDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 raise BleakError("Device disconnected during binding")
             
             _LOGGER.info("✓ Binding completed successfully")
+            self._async_save_binding(subscribed)
             
         except Exception as err:
             _LOGGER.error("✗ Error during binding: %s", err)
             raise
     
+    async def _async_wait_first_notification(self) -> None:
+        """Wait for the first notification after binding and learn how long it takes."""
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(self._first_notification.wait(), self._settle_timeout)
+        except asyncio.TimeoutError:
+            # Some devices only notify on change, so silence is not an error
+            _LOGGER.debug(
+                "No notification from %s within %.1fs of binding",
+                self._address,
+                self._settle_timeout,
+            )
+            return
+        
+        elapsed = time.monotonic() - start
+        self._settle_timeout = min(
+            BINDING_SETTLE_MAX, max(BINDING_SETTLE_MIN, elapsed * 2)
+        )
+        _LOGGER.debug(
+            "First notification from %s after %.2fs, next wait %.2fs",
+            self._address,
+            elapsed,
+            self._settle_timeout,
+        )
+
+    async def _async_replay_binding(self, client: BleakClientWithServiceCache) -> bool:
+        """Re-subscribe the recorded notification handles in one batch.
+
+        Returns False if the recorded binding no longer matches the device
+        and a full binding is needed.
+        """
+        chars = [client.services.get_characteristic(handle) for handle in self._bound_handles]
+        if None in chars:
+            _LOGGER.debug(
+                "Recorded binding for %s does not match its services, rebinding",
+                self._address,
+            )
+            return False
+        
+        try:
+            for char in chars:
+                await client.start_notify(char, self._notification_handler)
+        except BleakError as err:
+            _LOGGER.debug("Could not restore binding for %s: %s", self._address, err)
+            return False
+        
+        _LOGGER.debug(
+            "Restored %d notification subscriptions on %s",
+            len(chars),
+            self._address,
+        )
+        return True
+
+    @callback
+    def _async_save_binding(self, handles: list[int]) -> None:
+        """Record the binding in the config entry so it survives restarts."""
+        self._bound_handles = handles
+        binding = {
+            "handles": handles,
+            "bound": True,
+            "settle": round(self._settle_timeout, 2),
+        }
+        if self._entry.data.get(CONF_BINDING) != binding:
+            self.hass.config_entries.async_update_entry(
+                self._entry, data={**self._entry.data, CONF_BINDING: binding}
+            )
+
     @callback
-    def _notification_handler(self, sender: int, data: bytearray) -> None:
-        """Handle BLE notifications from the device."""
-        _LOGGER.debug("Notification from handle %s: %s", sender, data.hex())
-        # Handle notifications and update data as needed
-        # This will be called when the device sends notifications
+    def _notification_handler(
+        self, sender: BleakGATTCharacteristic | int, data: bytearray
+    ) -> None:
+        """Handle BLE notifications from the device and push them to entities."""
+        uuid = self._characteristic_uuid(sender)
+        _LOGGER.debug("Notification from %s: %s", uuid or sender, data.hex())
+        if uuid is None:
+            return
+        
+        now = time.monotonic()
+        if (channel := self._channels.get(uuid)) is None:
+            channel = self._channels[uuid] = NotifyChannel(NOTIFY_FRAMING.get(uuid))
+        self.stats.notifications += 1
+        if not channel.feed(data, now):
+            # Fragment of a frame that is not complete yet
+            return
+        
+        self._last_notification = self._last_activity = now
+        self._first_notification.set()
+        self._pending_notifications.add(uuid)
+        if uuid in _ALARM_UUIDS:
+            # Alarm-class fields are never held back
+            self._flush_notifications()
+        elif self._flush_handle is None:
+            # Merge everything that arrives within the window into one update
+            self._flush_handle = self.hass.loop.call_later(
+                self._coalesce_window, self._flush_notifications
+            )
+
+    @callback
+    def _flush_notifications(self) -> None:
+        """Decode every frame received in the window and push one update."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        for uuid in self._pending_notifications:
+            for frame in self._channels[uuid].unread():
+                self._store_frame(uuid, bytes(frame))
+        self._pending_notifications.clear()
+        self.device_read = True
+        self._set_push_mode(True)
+        self.async_set_updated_data(self._build_snapshot())
+
+    def _store_frame(self, uuid: str, value: bytes) -> None:
+        """Decode a notified frame and merge its fields into the latest per key."""
+        frame_key = DECODER.frame_key(uuid, value)
+        decoded = DECODER.decode(uuid, value)
+        if decoded is None:
+            decoded = self._decode_value(value)
+        elif (previous := self._decoded.get(frame_key)) is not None and isinstance(
+            previous[1], dict
+        ):
+            # A short frame leaves out trailing fields, keep their last values
+            decoded = {**previous[1], **decoded}
+        self._raw_values[frame_key] = value
+        self._decoded[frame_key] = (value, decoded)
+
+    def _characteristic_uuid(self, sender: BleakGATTCharacteristic | int) -> str | None:
+        """Resolve a notification sender to its characteristic UUID."""
+        if isinstance(sender, BleakGATTCharacteristic):
+            return sender.uuid
+        # Older bleak backends pass the handle only
+        if self._client is None:
+            return None
+        char = self._client.services.get_characteristic(sender)
+        return char.uuid if char else None
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return connection state and timings for a diagnostics download."""
+        return {
+            "address": self._address,
+            "connected": self._connection.is_connected,
+            "push_active": self.push_active,
+            "connection_policy": self._connection_policy,
+            "queued_writes": len(self._commands),
+            "merged_writes": self._commands.merged,
+            "update_interval": self.update_interval.total_seconds()
+            if self.update_interval
+            else None,
+            "read_plan": {
+                handle: {
+                    "uuid": entry.char.uuid,
+                    "unchanged": self._unchanged_reads.get(entry.char.uuid, 0),
+                }
+                for handle, entry in (self._read_plan or {}).items()
+            },
+            "static_characteristics": sorted(self._static_values),
+            "bound_handles": self._bound_handles,
+            "stats": asdict(self.stats),
+            "notify_channels": {
+                uuid: channel.diagnostics() for uuid, channel in self._channels.items()
+            },
+            "history": self.history.diagnostics(),
+            "raw_values": {
+                _frame_key_label(frame_key): value.hex()
+                for frame_key, value in self._raw_values.items()
+            },
+        }
 
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        if self._command_task is not None:
+            self._command_task.cancel()
+            self._command_task = None
+        self._commands.cancel_all()
         await self._disconnect()
+        if self._store_dirty:
+            # Write now rather than leave the delayed save pending, which
+            # would recreate the file after async_remove_entry deleted it
+            await self._store.async_save(self._cache_data())
@@ -0,0 +1,109 @@
+"""Declarative binary frame decoder for Matson Monitor payloads."""
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+import struct
+
+from .const import ADVERTISEMENT_SCHEMAS, FRAME_SCHEMAS
+
+# (key, offset, struct format, scale, unit) as declared in FRAME_SCHEMAS
+FieldSchema = tuple[str, int, str, float, str | None]
+FrameKey = str | tuple[str, int]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledField:
+    """A schema field with its struct layout compiled."""
+
+    key: str
+    offset: int
+    layout: struct.Struct
+    scale: float
+    digits: int | None
+    unit: str | None
+
+
+def _compile_field(field: FieldSchema) -> CompiledField:
+    """Compile one schema field."""
+    key, offset, fmt, scale, unit = field
+    digits = None
+    if scale != 1:
+        # Round away float noise to the decimal places of the scale itself,
+        # e.g. 0.25 keeps two
+        digits = max(0, -Decimal(str(scale)).as_tuple().exponent)
+    return CompiledField(key, offset, struct.Struct(fmt), scale, digits, unit)
+
+
+class FrameDecoder:
+    """Decode characteristic payloads to typed values using frame schemas.
+
+    Schemas are keyed either by characteristic UUID or by
+    (UUID, frame type byte) for characteristics that multiplex several
+    frame types. The frame type is the first byte of the payload.
+    """
+
+    def __init__(self, schemas: Mapping[FrameKey, Sequence[FieldSchema]]) -> None:
+        """Compile the schemas."""
+        self._by_uuid: dict[str, tuple[CompiledField, ...]] = {}
+        self._by_type: dict[tuple[str, int], tuple[CompiledField, ...]] = {}
+        self.fields: dict[str, CompiledField] = {}
+        # Keys each characteristic can produce, across all its frame types
+        keys_by_uuid: dict[str, set[str]] = {}
+        
+        for frame_key, field_schemas in schemas.items():
+            fields = tuple(_compile_field(field) for field in field_schemas)
+            if isinstance(frame_key, tuple):
+                self._by_type[frame_key] = fields
+            else:
+                self._by_uuid[frame_key] = fields
+            uuid = frame_key[0] if isinstance(frame_key, tuple) else frame_key
+            for field in fields:
+                self.fields[field.key] = field
+                keys_by_uuid.setdefault(uuid, set()).add(field.key)
+        
+        self.keys_by_uuid = {uuid: frozenset(keys) for uuid, keys in keys_by_uuid.items()}
+        
+        self._typed_uuids = frozenset(uuid for uuid, _ in self._by_type)
+
+    def handles(self, uuid: str) -> bool:
+        """Return True if payloads from this characteristic have a schema."""
+        return uuid in self._by_uuid or uuid in self._typed_uuids
+
+    def frame_key(self, uuid: str, value: bytes) -> FrameKey:
+        """Return the key a payload is kept under.
+
+        Frame types with their own schema are kept per (UUID, frame type),
+        so the latest frame of one type does not replace another type's.
+        """
+        if value and uuid in self._typed_uuids and (uuid, value[0]) in self._by_type:
+            return (uuid, value[0])
+        return uuid
+
+    def decode(self, uuid: str, value: bytes) -> dict[str, int | float] | None:
+        """Decode a payload, or return None if no schema matches it."""
+        fields = None
+        if value and uuid in self._typed_uuids:
+            fields = self._by_type.get((uuid, value[0]))
+        if fields is None:
+            fields = self._by_uuid.get(uuid)
+        if fields is None:
+            return None
+        
+        decoded: dict[str, int | float] = {}
+        size = len(value)
+        for field in fields:
+            if field.offset + field.layout.size > size:
+                # Short frame, skip fields it does not carry
+                continue
+            (raw,) = field.layout.unpack_from(value, field.offset)
+            if field.digits is None:
+                decoded[field.key] = raw
+            else:
+                decoded[field.key] = round(raw * field.scale, field.digits)
+        return decoded
+
+
+DECODER = FrameDecoder(FRAME_SCHEMAS)
+ADVERTISEMENT_DECODER = FrameDecoder(ADVERTISEMENT_SCHEMAS)
@@ -0,0 +1,29 @@
+"""Diagnostics support for Matson Monitor."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import MatsonDataUpdateCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: MatsonDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    
+    return {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": coordinator.diagnostics(),
+        "data": dict(coordinator.data or {}),
+    }
@@ -0,0 +1,156 @@
+"""Discovery index and batched onboarding for Matson Monitor devices."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+import logging
+import time
+
+from homeassistant.components import bluetooth
+from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
+    BluetoothChange,
+    BluetoothScanningMode,
+    BluetoothServiceInfoBleak,
+)
+from homeassistant.config_entries import SOURCE_INTEGRATION_DISCOVERY
+from homeassistant.const import CONF_ADDRESS, CONF_NAME, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    DATA_DISCOVERY,
+    DEVICE_NAME_PREFIX,
+    DISCOVERY_MAX_AGE,
+    DOMAIN,
+    ONBOARDING_STAGGER,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class DiscoveredMonitor:
+    """Last advertisement seen from a Matson Monitor."""
+
+    address: str
+    name: str
+    rssi: int
+    connectable: bool
+    last_seen: float
+
+    @property
+    def age(self) -> float:
+        """Return seconds since the device was last heard."""
+        return time.monotonic() - self.last_seen
+
+
+def _is_matson(service_info: BluetoothServiceInfoBleak) -> bool:
+    """Return True if an advertisement comes from a Matson Monitor."""
+    name = service_info.name
+    return bool(name) and name.upper().startswith(DEVICE_NAME_PREFIX.upper())
+
+
+class MatsonDiscoveryIndex:
+    """Matson Monitors heard on any adapter or proxy, keyed by address.
+
+    Advertisements are matched by name once as they arrive, so the config
+    flow reads a short index instead of filtering every advertisement
+    Home Assistant has seen.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._devices: dict[str, DiscoveredMonitor] = {}
+
+    @callback
+    def async_update(self, service_info: BluetoothServiceInfoBleak) -> None:
+        """Record an advertisement, keeping the best-connectable view."""
+        address = service_info.address
+        current = self._devices.get(address)
+        connectable = service_info.connectable or (
+            current is not None
+            and current.connectable
+            and current.age < DISCOVERY_MAX_AGE
+        )
+        self._devices[address] = DiscoveredMonitor(
+            address=address,
+            name=service_info.name or (current.name if current else address),
+            rssi=service_info.rssi,
+            connectable=connectable,
+            last_seen=service_info.time,
+        )
+
+    @callback
+    def async_devices(self, exclude: Iterable[str] = ()) -> list[DiscoveredMonitor]:
+        """Return recently seen devices, strongest signal first."""
+        excluded = set(exclude)
+        return sorted(
+            (
+                device
+                for address, device in self._devices.items()
+                if address not in excluded and device.age < DISCOVERY_MAX_AGE
+            ),
+            key=lambda device: device.rssi,
+            reverse=True,
+        )
+
+    def get(self, address: str) -> DiscoveredMonitor | None:
+        """Return the index entry for an address."""
+        return self._devices.get(address)
+
+
+@callback
+def async_get_discovery_index(hass: HomeAssistant) -> MatsonDiscoveryIndex:
+    """Return the domain-wide discovery index, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (index := domain_data.get(DATA_DISCOVERY)) is not None:
+        return index
+
+    index = domain_data[DATA_DISCOVERY] = MatsonDiscoveryIndex()
+    # Seed from what has been heard already, then follow new advertisements
+    for service_info in bluetooth.async_discovered_service_info(hass, connectable=False):
+        if _is_matson(service_info):
+            index.async_update(service_info)
+
+    @callback
+    def _async_advertisement(
+        service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        if _is_matson(service_info):
+            index.async_update(service_info)
+
+    unsubscribes = [
+        bluetooth.async_register_callback(
+            hass,
+            _async_advertisement,
+            BluetoothCallbackMatcher(local_name=f"{prefix}*", connectable=False),
+            BluetoothScanningMode.PASSIVE,
+        )
+        for prefix in {DEVICE_NAME_PREFIX, DEVICE_NAME_PREFIX.upper()}
+    ]
+
+    @callback
+    def _async_stop(event: Event) -> None:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    return index
+
+
+async def async_onboard(hass: HomeAssistant, devices: list[DiscoveredMonitor]) -> None:
+    """Add devices one at a time so their first connects do not collide.
+
+    Each device waits ONBOARDING_STAGGER after the previous entry was set
+    up, which spreads first connects out across adapters as well as on the
+    shared scheduler queue of each one.
+    """
+    for device in devices:
+        await asyncio.sleep(ONBOARDING_STAGGER)
+        _LOGGER.debug("Onboarding %s (%s)", device.name, device.address)
+        await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": SOURCE_INTEGRATION_DISCOVERY},
+            data={CONF_ADDRESS: device.address, CONF_NAME: device.name},
+        )
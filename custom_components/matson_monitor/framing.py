@@ -0,0 +1,231 @@
+"""Notification frame reassembly and history for Matson Monitor."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from .const import NOTIFY_MAX_FRAME, NOTIFY_RING_CAPACITY
+
+
+@dataclass(frozen=True, slots=True)
+class FramingSpec:
+    """How notification fragments join into frames on one characteristic.
+
+    Frames are either length prefixed (length_offset set, the frame is
+    header + length bytes + checksum) or terminated by a byte. A start byte,
+    if set, is used to resync after garbage.
+    """
+
+    start: int | None = None
+    length_offset: int | None = None
+    header: int = 0
+    terminator: int | None = None
+    checksum: str | None = None  # "sum8" or "xor8", last byte of the frame
+    max_frame: int = NOTIFY_MAX_FRAME
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> FramingSpec:
+        """Build a spec from a NOTIFY_FRAMING entry."""
+        return cls(**config)
+
+
+def _checksum_ok(kind: str, frame: memoryview) -> bool:
+    """Verify the trailing checksum byte of a frame."""
+    body = frame[:-1]
+    if kind == "sum8":
+        expected = sum(body) & 0xFF
+    else:
+        expected = 0
+        for byte in body:
+            expected ^= byte
+    return frame[-1] == expected
+
+
+class FrameAssembler:
+    """Join MTU-sized fragments into complete frames.
+
+    Fragments are copied once into a preallocated buffer. feed() returns
+    memoryviews into that buffer, which stay valid until the next feed().
+    """
+
+    def __init__(self, spec: FramingSpec) -> None:
+        """Initialize the assembler."""
+        self._spec = spec
+        self._buffer = bytearray(spec.max_frame * 2)
+        self._view = memoryview(self._buffer)
+        self._start = 0
+        self._end = 0
+        self.overflows = 0
+        self.checksum_errors = 0
+
+    def feed(self, data: bytes | bytearray) -> list[memoryview]:
+        """Add a fragment and return the frames it completed."""
+        # Move the partial frame left over from the last call to the front
+        pending = self._end - self._start
+        if self._start:
+            self._view[:pending] = self._view[self._start:self._end]
+            self._start, self._end = 0, pending
+
+        size = len(data)
+        if self._end + size > len(self._buffer):
+            # A frame longer than max_frame, drop what we have and resync
+            self.overflows += 1
+            self._start = self._end = 0
+            if size > len(self._buffer):
+                return []
+        self._view[self._end:self._end + size] = data
+        self._end += size
+
+        frames: list[memoryview] = []
+        while (frame := self._next_frame()) is not None:
+            if self._spec.checksum and not _checksum_ok(self._spec.checksum, frame):
+                self.checksum_errors += 1
+                continue
+            frames.append(frame)
+        return frames
+
+    def _next_frame(self) -> memoryview | None:
+        """Cut the next complete frame from the buffer, if there is one."""
+        spec = self._spec
+        buffer = self._buffer
+
+        if spec.start is not None:
+            index = buffer.find(spec.start, self._start, self._end)
+            if index < 0:
+                self._start = self._end
+                return None
+            self._start = index
+
+        if spec.length_offset is not None:
+            if self._end - self._start <= spec.length_offset:
+                return None
+            length = spec.header + buffer[self._start + spec.length_offset]
+            if spec.checksum:
+                length += 1
+            if length > spec.max_frame:
+                # Corrupt length, skip this byte and resync
+                self._start += 1
+                return self._next_frame()
+            if self._end - self._start < length:
+                return None
+            end = self._start + length
+            frame = self._view[self._start:end]
+            self._start = end
+            return frame
+
+        if spec.terminator is not None:
+            index = buffer.find(spec.terminator, self._start, self._end)
+            if index < 0:
+                return None
+            frame = self._view[self._start:index]
+            self._start = index + 1
+            return frame
+
+        # No framing: every fragment is a frame
+        if self._start == self._end:
+            return None
+        frame = self._view[self._start:self._end]
+        self._start = self._end
+        return frame
+
+
+class FrameRing:
+    """Fixed-capacity ring of the latest frames and their timestamps."""
+
+    def __init__(self, capacity: int = NOTIFY_RING_CAPACITY, max_frame: int = NOTIFY_MAX_FRAME) -> None:
+        """Preallocate the ring."""
+        self._capacity = capacity
+        self._max_frame = max_frame
+        self._slots = bytearray(capacity * max_frame)
+        self._view = memoryview(self._slots)
+        self._lengths = array("H", bytes(2 * capacity))
+        self._times = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of frames held."""
+        return self._count
+
+    def append(self, frame: bytes | bytearray | memoryview, timestamp: float) -> None:
+        """Copy a frame into the next slot, truncating oversize frames."""
+        size = len(frame)
+        if size > self._max_frame:
+            size = self._max_frame
+            frame = memoryview(frame)[:size]
+        offset = self._next * self._max_frame
+        self._view[offset:offset + size] = frame
+        self._lengths[self._next] = size
+        self._times[self._next] = timestamp
+        self._next = (self._next + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def _slot(self, index: int) -> memoryview:
+        offset = index * self._max_frame
+        return self._view[offset:offset + self._lengths[index]]
+
+    def latest(self) -> memoryview | None:
+        """Return the newest frame, valid until it is overwritten."""
+        if not self._count:
+            return None
+        return self._slot((self._next - 1) % self._capacity)
+
+    def frames(self, count: int | None = None) -> Iterator[tuple[float, memoryview]]:
+        """Yield (timestamp, frame) from oldest to newest, only the newest count if given."""
+        count = self._count if count is None else min(count, self._count)
+        first = (self._next - count) % self._capacity
+        for step in range(count):
+            index = (first + step) % self._capacity
+            yield self._times[index], self._slot(index)
+
+
+class NotifyChannel:
+    """Reassembly and history for notifications from one characteristic."""
+
+    def __init__(self, config: Mapping[str, Any] | None = None) -> None:
+        """Initialize the channel, unframed if no config is given."""
+        spec = FramingSpec.from_config(config) if config else None
+        self._assembler = FrameAssembler(spec) if spec else None
+        self.ring = FrameRing(max_frame=spec.max_frame if spec else NOTIFY_MAX_FRAME)
+        self.frames = 0
+        # Frames received since the last unread() call, and frames the ring
+        # overwrote before they were taken
+        self._unread = 0
+        self.dropped = 0
+
+    def feed(self, data: bytes | bytearray, timestamp: float) -> int:
+        """Add a notification payload, returns how many frames it completed."""
+        if self._assembler is None:
+            self.ring.append(data, timestamp)
+            self.frames += 1
+            self._unread += 1
+            return 1
+
+        completed = self._assembler.feed(data)
+        for frame in completed:
+            self.ring.append(frame, timestamp)
+        self.frames += len(completed)
+        self._unread += len(completed)
+        return len(completed)
+
+    def unread(self) -> Iterator[memoryview]:
+        """Return the frames received since the last call, oldest first.
+
+        The frames are views into the ring, valid until it wraps around.
+        """
+        count, self._unread = self._unread, 0
+        if count > len(self.ring):
+            self.dropped += count - len(self.ring)
+        return (frame for _, frame in self.ring.frames(count))
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return counters for a diagnostics download."""
+        return {
+            "frames": self.frames,
+            "buffered": len(self.ring),
+            "dropped": self.dropped,
+            "overflows": self._assembler.overflows if self._assembler else 0,
+            "checksum_errors": self._assembler.checksum_errors if self._assembler else 0,
+        }
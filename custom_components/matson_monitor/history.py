@@ -0,0 +1,203 @@
+"""Compact in-memory sample history for Matson Monitor numeric fields."""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Mapping
+from typing import Any
+
+from .const import HISTORY_LEVELS, HISTORY_RAW_CAPACITY, HISTORY_SAMPLE_INTERVAL
+
+
+class SampleSeries:
+    """Fixed-capacity ring of (timestamp, value) samples.
+
+    A running sum and monotonic deques keep mean, min and max over the
+    samples held available in amortised O(1) per append.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_times",
+        "_values",
+        "_next",
+        "_count",
+        "_seq",
+        "_sum",
+        "_min",
+        "_max",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        """Preallocate the series."""
+        self._capacity = capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("f", bytes(4 * capacity))
+        self._next = 0
+        self._count = 0
+        self._seq = 0
+        self._sum = 0.0
+        # (sequence number, value) candidates for the window min and max
+        self._min: deque[tuple[int, float]] = deque()
+        self._max: deque[tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples held."""
+        return self._count
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Add a sample, evicting the oldest once full."""
+        if self._count == self._capacity:
+            self._sum -= self._values[self._next]
+            evicted = self._seq - self._capacity
+            if self._min and self._min[0][0] <= evicted:
+                self._min.popleft()
+            if self._max and self._max[0][0] <= evicted:
+                self._max.popleft()
+        else:
+            self._count += 1
+
+        self._times[self._next] = timestamp
+        self._values[self._next] = value
+        # Use the stored float32 so the running sum matches what is evicted
+        value = self._values[self._next]
+        self._sum += value
+        self._next = (self._next + 1) % self._capacity
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((self._seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((self._seq, value))
+        self._seq += 1
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the smallest sample held."""
+        return self._min[0][1] if self._count else None
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the largest sample held."""
+        return self._max[0][1] if self._count else None
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the samples held."""
+        return self._sum / self._count if self._count else None
+
+    @property
+    def rate(self) -> float | None:
+        """Return the change per second between the oldest and newest sample."""
+        if self._count < 2:
+            return None
+        first = (self._next - self._count) % self._capacity
+        last = (self._next - 1) % self._capacity
+        elapsed = self._times[last] - self._times[first]
+        if elapsed <= 0:
+            return None
+        return (self._values[last] - self._values[first]) / elapsed
+
+    def samples(self) -> list[tuple[float, float]]:
+        """Return the samples from oldest to newest."""
+        first = (self._next - self._count) % self._capacity
+        return [
+            (self._times[index], self._values[index])
+            for index in ((first + step) % self._capacity for step in range(self._count))
+        ]
+
+
+class FieldHistory:
+    """Raw samples of one field plus downsampled means at coarser resolutions."""
+
+    __slots__ = ("raw", "levels", "_buckets", "_last_sample")
+
+    def __init__(self) -> None:
+        """Initialize the resolutions from HISTORY_LEVELS."""
+        self.raw = SampleSeries(HISTORY_RAW_CAPACITY)
+        self.levels: dict[int, SampleSeries] = {
+            period: SampleSeries(capacity) for period, capacity in HISTORY_LEVELS
+        }
+        # Open bucket per resolution: [bucket index, sample count, sum]
+        self._buckets: dict[int, list[float]] = {
+            period: [-1, 0, 0.0] for period in self.levels
+        }
+        self._last_sample = float("-inf")
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Record a sample at every resolution, at most one per sample interval."""
+        if timestamp - self._last_sample < HISTORY_SAMPLE_INTERVAL:
+            return
+        self._last_sample = timestamp
+        self.raw.append(timestamp, value)
+        self.close(timestamp)
+        for bucket in self._buckets.values():
+            bucket[1] += 1
+            bucket[2] += value
+
+    def close(self, timestamp: float) -> None:
+        """Close every bucket whose period ended before timestamp into its mean."""
+        for period, series in self.levels.items():
+            bucket = self._buckets[period]
+            index = timestamp // period
+            if index != bucket[0]:
+                if bucket[1]:
+                    series.append(bucket[0] * period, bucket[2] / bucket[1])
+                bucket[0], bucket[1], bucket[2] = index, 0, 0.0
+
+    def statistics(self) -> dict[str, float | None]:
+        """Return min, max, mean and rate per minute over the raw window."""
+        rate = self.raw.rate
+        return {
+            "min": _round(self.raw.minimum),
+            "max": _round(self.raw.maximum),
+            "mean": _round(self.raw.mean),
+            "rate_per_minute": _round(rate * 60 if rate is not None else None),
+        }
+
+
+class DeviceHistory:
+    """Sample history for every numeric field of one device.
+
+    Values are sampled on time, at most once per field per
+    HISTORY_SAMPLE_INTERVAL, changed or not: the window covers the same
+    span whether snapshots come from a slow poll or a stream of
+    advertisements, and a value that sits flat keeps its statistics current.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty history."""
+        self.fields: dict[str, FieldHistory] = {}
+
+    def record(self, timestamp: float, data: Mapping[str, Any]) -> None:
+        """Record every numeric value of a snapshot and close finished buckets."""
+        for key, value in data.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                if (history := self.fields.get(key)) is None:
+                    history = self.fields[key] = FieldHistory()
+                history.add(timestamp, value)
+        # Fields missing from this snapshot still close their buckets on time
+        for history in self.fields.values():
+            history.close(timestamp)
+
+    def statistics(self, key: str) -> dict[str, float | None] | None:
+        """Return derived statistics for a field, or None if it has no history."""
+        history = self.fields.get(key)
+        return history.statistics() if history else None
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return per-field statistics and sample counts."""
+        return {
+            key: {
+                **history.statistics(),
+                "samples": len(history.raw),
+                **{f"samples_{period}s": len(series) for period, series in history.levels.items()},
+            }
+            for key, history in self.fields.items()
+        }
+
+
+def _round(value: float | None) -> float | None:
+    """Round float32 noise off a statistic."""
+    return round(value, 4) if value is not None else None
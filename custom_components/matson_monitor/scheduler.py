@@ -0,0 +1,112 @@
+"""Shared Bluetooth scheduling for Matson Monitor devices."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import logging
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_SCHEDULER, DOMAIN, SCHEDULER_ADAPTER_CONCURRENCY, SCHEDULER_MIN_GAP
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _AdapterQueue:
+    """Priority gate for radio work on one adapter or proxy.
+
+    Waiters with the lowest priority value go first, so devices whose data
+    is stalest are served before ones that were refreshed recently.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the queue."""
+        self._limit = limit
+        self._active = 0
+        self._waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+        self._last_release = 0.0
+
+    async def acquire(self, priority: float) -> None:
+        """Wait for a turn on the adapter."""
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            entry = (priority, next(self._counter), future)
+            heapq.heappush(self._waiters, entry)
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was handed over just as we were cancelled
+                    self.release()
+                # Otherwise the cancelled future stays in the heap, where
+                # release() may already have popped it; release() skips it
+                raise
+        
+        # Rate limit back-to-back operations on the same adapter
+        gap = self._last_release + SCHEDULER_MIN_GAP - time.monotonic()
+        if gap > 0:
+            try:
+                await asyncio.sleep(gap)
+            except asyncio.CancelledError:
+                self.release()
+                raise
+
+    def release(self) -> None:
+        """Hand the turn to the next waiter, or free it."""
+        self._last_release = time.monotonic()
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+
+class MatsonScheduler:
+    """Serialise connects and reads per adapter across all Matson Monitors."""
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._queues: dict[str, _AdapterQueue] = {}
+
+    @asynccontextmanager
+    async def async_radio_slot(
+        self, adapter: str, address: str, last_success: float | None
+    ) -> AsyncIterator[None]:
+        """Hold a turn on an adapter for the duration of the block.
+
+        last_success is the monotonic time of the device's last good
+        refresh; devices that never succeeded go first.
+        """
+        queue = self._queues.get(adapter)
+        if queue is None:
+            queue = self._queues[adapter] = _AdapterQueue(SCHEDULER_ADAPTER_CONCURRENCY)
+        
+        start = time.monotonic()
+        await queue.acquire(last_success or 0.0)
+        _LOGGER.debug(
+            "%s got a radio slot on %s after %.2fs",
+            address,
+            adapter,
+            time.monotonic() - start,
+        )
+        try:
+            yield
+        finally:
+            queue.release()
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> MatsonScheduler:
+    """Return the domain-wide scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := domain_data.get(DATA_SCHEDULER)) is None:
+        scheduler = domain_data[DATA_SCHEDULER] = MatsonScheduler()
+    return scheduler
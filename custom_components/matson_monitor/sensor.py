@@ -7,19 +7,26 @@ import logging
 from typing import Any
 
 from homeassistant.components.sensor import (
-    SensorEntity,
+    RestoreSensor,
+    SensorDeviceClass,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import SIGNAL_STRENGTH_DECIBELS_MILLIWATT
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import MatsonDataUpdateCoordinator
+from .coordinator import MatsonDataUpdateCoordinator, MatsonStats
+from .decoder import ADVERTISEMENT_DECODER, DECODER
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,7 +35,17 @@ _LOGGER = logging.getLogger(__name__)
 class MatsonSensorEntityDescription(SensorEntityDescription):
     """Describes Matson sensor entity."""
 
-    value_fn: Callable[[dict[str, Any]], Any] | None = None
+    # Numeric changes smaller than this are not written to the state machine
+    deadband: float | None = None
+    # Diagnostic sensors read the coordinator's stats instead of its data
+    stats_fn: Callable[[MatsonStats], Any] | None = None
+    # Expose min/max/mean/rate from the coordinator's sample history
+    statistics: bool = False
+
+
+def _ms(value: float | None) -> float | None:
+    """Round a millisecond timing for display."""
+    return round(value, 1) if value is not None else None
 
 
 SENSORS: tuple[MatsonSensorEntityDescription, ...] = (
@@ -37,11 +54,103 @@ SENSORS: tuple[MatsonSensorEntityDescription, ...] = (
         name="Signal Strength",
         native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda data: data.get("rssi"),
+        deadband=3,
+    ),
+)
+
+DIAGNOSTIC_SENSORS: tuple[MatsonSensorEntityDescription, ...] = (
+    MatsonSensorEntityDescription(
+        key="connect_duration",
+        name="Connect Duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        stats_fn=lambda stats: _ms(stats.connect_ms),
+    ),
+    MatsonSensorEntityDescription(
+        key="bind_duration",
+        name="Bind Duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        stats_fn=lambda stats: _ms(stats.bind_ms),
+    ),
+    MatsonSensorEntityDescription(
+        key="read_duration",
+        name="Read Duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        stats_fn=lambda stats: _ms(stats.read_cycle_ms),
+    ),
+    MatsonSensorEntityDescription(
+        key="parse_duration",
+        name="Parse Duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        stats_fn=lambda stats: _ms(stats.parse_ms),
+    ),
+    MatsonSensorEntityDescription(
+        key="bytes_read",
+        name="Bytes Read",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        stats_fn=lambda stats: stats.bytes_read,
     ),
+    MatsonSensorEntityDescription(
+        key="reconnects",
+        name="Reconnects",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        stats_fn=lambda stats: stats.reconnects,
+    ),
+)
+
+
+# Keys in coordinator data that never get their own dynamic sensor
+_FIXED_KEYS = frozenset(
+    description.key for description in (*SENSORS, *DIAGNOSTIC_SENSORS)
 )
 
 
+# Descriptions by data key, built once for every field the decoder schemas
+# define (frame fields win over advertised ones) and filled in for other
+# keys the first time any device reports them
+_DYNAMIC_DESCRIPTIONS: dict[str, MatsonSensorEntityDescription] = {
+    key: MatsonSensorEntityDescription(
+        key=key,
+        name=key.replace("_", " ").title(),
+        native_unit_of_measurement=field.unit,
+        state_class=SensorStateClass.MEASUREMENT,
+        statistics=True,
+    )
+    for decoder in (ADVERTISEMENT_DECODER, DECODER)
+    for key, field in decoder.fields.items()
+}
+
+
+def _dynamic_description(key: str) -> MatsonSensorEntityDescription:
+    """Return the description for a key discovered in the device's data."""
+    if (description := _DYNAMIC_DESCRIPTIONS.get(key)) is None:
+        description = _DYNAMIC_DESCRIPTIONS[key] = MatsonSensorEntityDescription(
+            key=key, name=key.replace("_", " ").title()
+        )
+    return description
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -52,33 +161,43 @@ async def async_setup_entry(
     
     entities = [
         MatsonSensorEntity(coordinator, entry, description)
-        for description in SENSORS
+        for description in (*SENSORS, *DIAGNOSTIC_SENSORS)
     ]
     
-    # Add dynamic sensors based on discovered characteristics
-    if coordinator.data:
-        for key in coordinator.data.keys():
-            if key not in ["rssi", "raw_data"] and not any(s.key == key for s in SENSORS):
-                entities.append(
-                    MatsonSensorEntity(
-                        coordinator,
-                        entry,
-                        MatsonSensorEntityDescription(
-                            key=key,
-                            name=key.replace("_", " ").title(),
-                            value_fn=lambda data, k=key: data.get(k),
-                        ),
-                    )
-                )
+    # Setup does not wait for the first read, so dynamic sensors come from
+    # every key cached by earlier runs and keep stable entity ids even if a
+    # read misses a characteristic
+    added: set[str] = (coordinator.known_keys | set(coordinator.data or ())) - _FIXED_KEYS
+    entities.extend(
+        MatsonSensorEntity(coordinator, entry, _dynamic_description(key))
+        for key in sorted(added)
+    )
+    
+    @callback
+    def _async_add_new_keys() -> None:
+        """Add sensors for keys that appear after setup, without a reload."""
+        if not coordinator.new_keys:
+            return
+        new_keys = coordinator.new_keys - added - _FIXED_KEYS
+        if not new_keys:
+            return
+        added.update(new_keys)
+        async_add_entities(
+            MatsonSensorEntity(coordinator, entry, _dynamic_description(key))
+            for key in sorted(new_keys)
+        )
     
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_keys))
     async_add_entities(entities)
 
 
-class MatsonSensorEntity(CoordinatorEntity[MatsonDataUpdateCoordinator], SensorEntity):
+class MatsonSensorEntity(CoordinatorEntity[MatsonDataUpdateCoordinator], RestoreSensor):
     """Representation of a Matson Monitor sensor."""
 
     entity_description: MatsonSensorEntityDescription
     _attr_has_entity_name = True
+    # Derived statistics change with every reading, keep them out of the recorder
+    _unrecorded_attributes = frozenset({"min", "max", "mean", "rate_per_minute"})
 
     def __init__(
         self,
@@ -89,17 +208,90 @@ class MatsonSensorEntity(CoordinatorEntity[MatsonDataUpdateCoordinator], SensorE
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
+        # Last availability, value and statistics written to the state machine
+        self._written_available: bool | None = None
+        self._written_value: Any = None
+        self._written_statistics: dict[str, Any] | None = None
+        # Last known value shown until the device has been read this run
+        self._restored_value: Any = None
+        # Where this entity's value lives in the coordinator's snapshot
+        self._slot = -1
+        if description.stats_fn is None:
+            self._slot = coordinator.value_slot(description.key)
         self._attr_unique_id = f"{entry.unique_id}_{description.key}"
+        info = coordinator.device_info_fields
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry.unique_id)},
             name=entry.title,
-            manufacturer="Matson",
-            model="Monitor",
+            manufacturer=info.get("manufacturer", "Matson"),
+            model=info.get("model", "Monitor"),
+            sw_version=info.get("sw_version"),
+            hw_version=info.get("hw_version"),
+            serial_number=info.get("serial_number"),
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this entity's value, statistics or availability changed."""
+        available = self.available
+        statistics = self.extra_state_attributes
+        if available == self._written_available and statistics == self._written_statistics:
+            deadband = self.entity_description.deadband
+            value = self.native_value
+            if value == self._written_value:
+                return
+            if (
+                deadband is not None
+                and isinstance(value, (int, float))
+                and isinstance(self._written_value, (int, float))
+                and abs(value - self._written_value) < deadband
+            ):
+                return
+        
+        self._written_available = available
+        self._written_value = self.native_value
+        self._written_statistics = statistics
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last known value if the device has not been read yet."""
+        await super().async_added_to_hass()
+        # Not data is None: a replayed advertisement can fill the snapshot
+        # before platforms are set up, without reading anything
+        if self.entity_description.stats_fn is not None or self.coordinator.device_read:
+            return
+        key = self.entity_description.key
+        # The coordinator's cache is written more often than restore state
+        if key in self.coordinator.restored_data:
+            self._restored_value = self.coordinator.restored_data[key]
+        elif (last := await self.async_get_last_sensor_data()) is not None:
+            self._restored_value = last.native_value
+
+    @property
+    def available(self) -> bool:
+        """Return False until the device has been read, unless a value was restored."""
+        if (
+            self.entity_description.stats_fn is None
+            and not self.coordinator.device_read
+            and self._restored_value is None
+        ):
+            return False
+        return super().available
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return derived statistics from the sample history."""
+        if not self.entity_description.statistics:
+            return None
+        return self.coordinator.history.statistics(self.entity_description.key)
+
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        if self.entity_description.value_fn:
-            return self.entity_description.value_fn(self.coordinator.data)
-        return self.coordinator.data.get(self.entity_description.key)
+        if self.entity_description.stats_fn:
+            return self.entity_description.stats_fn(self.coordinator.stats)
+        if self.coordinator.data is None or (
+            not self.coordinator.device_read and self._restored_value is not None
+        ):
+            return self._restored_value
+        return self.coordinator.data.value_at(self._slot)
@@ -0,0 +1,83 @@
+"""Slot-based data snapshot for Matson Monitor devices."""
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+_MISSING = object()
+
+
+class MatsonSnapshot(Mapping[str, Any]):
+    """Latest value of every data key of one device.
+
+    A key is given a slot the first time it appears and keeps it for the
+    life of the coordinator, so entities resolve their slot once and read
+    their value by index. Each parse writes into the slots in place
+    between begin() and finish(), so no per-cycle dict is built.
+    """
+
+    __slots__ = ("_slots", "_keys", "_values", "_seen", "_cycle", "_changed")
+
+    def __init__(self) -> None:
+        """Initialize an empty snapshot."""
+        self._slots: dict[str, int] = {}
+        self._keys: list[str] = []
+        self._values: list[Any] = []
+        # Parse cycle in which each slot was last written
+        self._seen: list[int] = []
+        self._cycle = 0
+        self._changed: set[str] = set()
+
+    def slot(self, key: str) -> int:
+        """Return the slot of a key, allocating an empty one if it is new."""
+        if (index := self._slots.get(key)) is None:
+            index = self._slots[key] = len(self._values)
+            self._keys.append(key)
+            self._values.append(_MISSING)
+            self._seen.append(0)
+        return index
+
+    def value_at(self, index: int) -> Any:
+        """Return the value in a slot, None if the key is currently absent."""
+        value = self._values[index]
+        return None if value is _MISSING else value
+
+    def begin(self) -> None:
+        """Start writing a new parse."""
+        self._cycle += 1
+        self._changed = set()
+
+    def put(self, key: str, value: Any) -> None:
+        """Write a key's value for the current parse."""
+        index = self.slot(key)
+        self._seen[index] = self._cycle
+        if self._values[index] != value:
+            self._values[index] = value
+            self._changed.add(key)
+
+    def finish(self) -> set[str]:
+        """Clear keys the parse did not write, returns the keys that changed."""
+        cycle = self._cycle
+        values = self._values
+        for index, seen in enumerate(self._seen):
+            if seen != cycle and values[index] is not _MISSING:
+                values[index] = _MISSING
+                self._changed.add(self._keys[index])
+        return self._changed
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a key."""
+        index = self._slots[key]
+        if (value := self._values[index]) is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys that currently hold a value."""
+        return (
+            key for key, value in zip(self._keys, self._values) if value is not _MISSING
+        )
+
+    def __len__(self) -> int:
+        """Return the number of keys that currently hold a value."""
+        return sum(value is not _MISSING for value in self._values)
@@ -0,0 +1,14 @@
+"""Persistent per-entry cache for Matson Monitor."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_VERSION
+
+
+def cache_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding an entry's cached key set and snapshot."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Simulated MATSON Monitor GATT device for offline testing and benchmarks.
+
+FakeMatsonClient stands in for the BleakClient the integration uses. It
+can be scripted with services, per-operation latencies, notification
+streams and disconnect patterns, so no Bluetooth hardware is needed.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import struct
+
+MATSON_ADDRESS = "AA:BB:CC:DD:EE:FF"
+
+GENERIC_ACCESS = "00001800-0000-1000-8000-00805f9b34fb"
+DEVICE_INFO = "0000180a-0000-1000-8000-00805f9b34fb"
+BATTERY = "0000180f-0000-1000-8000-00805f9b34fb"
+MATSON_SERVICE = "0000ffe0-0000-1000-8000-00805f9b34fb"
+
+
+@dataclass
+class FakeCharacteristic:
+    """A scripted GATT characteristic."""
+
+    uuid: str
+    handle: int
+    properties: list[str]
+    value: bytes = b""
+    service_uuid: str = ""
+
+
+@dataclass
+class FakeService:
+    """A scripted GATT service."""
+
+    uuid: str
+    characteristics: list[FakeCharacteristic] = field(default_factory=list)
+
+
+class FakeServiceCollection:
+    """Minimal BleakGATTServiceCollection replacement."""
+
+    def __init__(self, services: list[FakeService]) -> None:
+        self._services = services
+        self._by_handle = {
+            char.handle: char for service in services for char in service.characteristics
+        }
+        self._by_uuid = {
+            char.uuid: char for service in services for char in service.characteristics
+        }
+
+    def __iter__(self):
+        return iter(self._services)
+
+    def get_characteristic(self, specifier: int | str | FakeCharacteristic):
+        if isinstance(specifier, FakeCharacteristic):
+            return specifier
+        if isinstance(specifier, int):
+            return self._by_handle.get(specifier)
+        return self._by_uuid.get(specifier)
+
+
+def default_services() -> list[FakeService]:
+    """Return a service table resembling a MATSON Monitor."""
+    handle = iter(range(3, 200, 2))
+
+    def char(uuid: str, props: list[str], value: bytes = b"") -> FakeCharacteristic:
+        return FakeCharacteristic(uuid, next(handle), props, value)
+
+    services = [
+        FakeService(GENERIC_ACCESS, [
+            char("00002a00-0000-1000-8000-00805f9b34fb", ["read"], b"MATSON Monitor"),
+            char("00002a01-0000-1000-8000-00805f9b34fb", ["read"], b"\x00\x00"),
+        ]),
+        FakeService(DEVICE_INFO, [
+            char("00002a24-0000-1000-8000-00805f9b34fb", ["read"], b"MM-100"),
+            char("00002a25-0000-1000-8000-00805f9b34fb", ["read"], b"SN000123"),
+            char("00002a26-0000-1000-8000-00805f9b34fb", ["read"], b"1.4.2"),
+            char("00002a27-0000-1000-8000-00805f9b34fb", ["read"], b"rev B"),
+            char("00002a29-0000-1000-8000-00805f9b34fb", ["read"], b"Matson"),
+        ]),
+        FakeService(BATTERY, [
+            char("00002a19-0000-1000-8000-00805f9b34fb", ["read", "notify"], b"\x57"),
+        ]),
+        FakeService(MATSON_SERVICE, [
+            char("0000ffe1-0000-1000-8000-00805f9b34fb", ["read", "notify"], b"\x01\x10\x05"),
+            char("0000ffe2-0000-1000-8000-00805f9b34fb", ["write", "write-without-response"]),
+        ]),
+    ]
+    for service in services:
+        for characteristic in service.characteristics:
+            characteristic.service_uuid = service.uuid
+    return services
+
+
+class FakeBLEDevice:
+    """Minimal BLEDevice replacement."""
+
+    def __init__(self, address: str = MATSON_ADDRESS, name: str = "MATSON Monitor") -> None:
+        self.address = address
+        self.name = name
+        self.rssi = -60
+        self.details: dict = {}
+
+
+class FakeMatsonClient:
+    """Scriptable stand-in for BleakClient / BleakClientWithServiceCache.
+
+    latency values are in seconds per operation. drop_after_ops disconnects
+    the link after that many GATT operations to exercise reconnect paths.
+    max_in_flight rejects operations beyond that many at once, like a
+    backend or proxy that does not allow overlapping requests.
+    """
+
+    def __init__(
+        self,
+        device: FakeBLEDevice | None = None,
+        services: list[FakeService] | None = None,
+        *,
+        connect_latency: float = 0.0,
+        read_latency: float = 0.0,
+        write_latency: float = 0.0,
+        notify_latency: float = 0.0,
+        drop_after_ops: int | None = None,
+        max_in_flight: int | None = None,
+        disconnected_callback: Callable[[FakeMatsonClient], None] | None = None,
+    ) -> None:
+        self.device = device or FakeBLEDevice()
+        self.services = FakeServiceCollection(services or default_services())
+        self.connect_latency = connect_latency
+        self.read_latency = read_latency
+        self.write_latency = write_latency
+        self.notify_latency = notify_latency
+        self.drop_after_ops = drop_after_ops
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self.disconnected_callback = disconnected_callback
+        self.is_connected = False
+        self.ops = 0
+        self.reads = 0
+        self.writes: list[tuple[str, bytes, bool]] = []
+        self._notify_callbacks: dict[int, Callable] = {}
+
+    async def connect(self, **kwargs) -> bool:
+        await asyncio.sleep(self.connect_latency)
+        self.is_connected = True
+        return True
+
+    async def disconnect(self) -> bool:
+        self._drop(expected=True)
+        return True
+
+    def clear_cache(self) -> None:
+        """Mirror BleakClientWithServiceCache.clear_cache."""
+
+    def _resolve(self, specifier) -> FakeCharacteristic:
+        char = self.services.get_characteristic(specifier)
+        if char is None:
+            raise KeyError(f"Unknown characteristic {specifier}")
+        return char
+
+    async def _operation(self, latency: float) -> None:
+        if not self.is_connected:
+            raise ConnectionError("Not connected")
+        if self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+            raise RuntimeError("Operation already in progress")
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            self.in_flight -= 1
+        self.ops += 1
+        if self.drop_after_ops is not None and self.ops >= self.drop_after_ops:
+            self._drop(expected=False)
+            raise ConnectionError("Simulated link loss")
+
+    def _drop(self, expected: bool) -> None:
+        was_connected = self.is_connected
+        self.is_connected = False
+        self._notify_callbacks.clear()
+        if was_connected and self.disconnected_callback:
+            self.disconnected_callback(self)
+
+    async def read_gatt_char(self, specifier) -> bytearray:
+        char = self._resolve(specifier)
+        await self._operation(self.read_latency)
+        self.reads += 1
+        return bytearray(char.value)
+
+    async def write_gatt_char(self, specifier, data: bytes, response: bool | None = None) -> None:
+        char = self._resolve(specifier)
+        await self._operation(self.write_latency)
+        self.writes.append((char.uuid, bytes(data), bool(response)))
+
+    async def start_notify(self, specifier, callback: Callable) -> None:
+        char = self._resolve(specifier)
+        await self._operation(self.notify_latency)
+        self._notify_callbacks[char.handle] = callback
+
+    async def stop_notify(self, specifier) -> None:
+        self._notify_callbacks.pop(self._resolve(specifier).handle, None)
+
+    def set_value(self, uuid: str, value: bytes) -> None:
+        """Change the value later reads return."""
+        self._resolve(uuid).value = value
+
+    def notify(self, uuid: str, value: bytes) -> bool:
+        """Deliver one notification, returns False if not subscribed."""
+        char = self._resolve(uuid)
+        char.value = value
+        if (callback := self._notify_callbacks.get(char.handle)) is None:
+            return False
+        # Older bleak backends pass the handle, which the coordinator resolves
+        callback(char.handle, bytearray(value))
+        return True
+
+    async def stream(self, uuid: str, frames: list[bytes], interval: float = 0.0) -> int:
+        """Deliver a stream of notifications, returns how many were delivered."""
+        delivered = 0
+        for frame in frames:
+            delivered += self.notify(uuid, frame)
+            await asyncio.sleep(interval)
+        return delivered
+
+
+def counter_frames(count: int, frame_type: int = 0x01) -> list[bytes]:
+    """Return notification frames carrying an incrementing 16-bit counter."""
+    return [struct.pack("<BH", frame_type, i & 0xFFFF) for i in range(count)]
+
+
+async def _demo() -> None:
+    """Connect to the simulated device and print its service table."""
+    client = FakeMatsonClient(read_latency=0.01)
+    await client.connect()
+    for service in client.services:
+        print(f"[SERVICE] {service.uuid}")
+        for char in service.characteristics:
+            value = await client.read_gatt_char(char) if "read" in char.properties else b""
+            print(f"  {char.uuid} handle={char.handle} {char.properties} {bytes(value)!r}")
+    await client.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(_demo())
@@ -0,0 +1,95 @@
+"""Shared helpers for the Matson Monitor tests.
+
+The coordinator runs against the simulated device in fake_matson.py, so
+no Bluetooth hardware is needed. Home Assistant must be installed.
+"""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import os
+import sys
+import tempfile
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_matson import FakeBLEDevice, FakeMatsonClient  # noqa: E402
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import device_registry as dr  # noqa: E402
+
+from custom_components.matson_monitor import (  # noqa: E402
+    coordinator as coordinator_module,
+    scheduler as scheduler_module,
+)
+from custom_components.matson_monitor.const import CONF_BINDING  # noqa: E402
+from custom_components.matson_monitor.coordinator import (  # noqa: E402
+    MatsonDataUpdateCoordinator,
+)
+from custom_components.matson_monitor.scheduler import MatsonScheduler  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def no_scheduler_gap():
+    """Do not rate limit back-to-back radio operations in tests."""
+    with patch.object(scheduler_module, "SCHEDULER_MIN_GAP", 0):
+        yield
+
+
+class Harness:
+    """A coordinator wired to simulated clients, one per connection."""
+
+    def __init__(self, hass: HomeAssistant, client_options: dict[str, Any]) -> None:
+        self.hass = hass
+        self.device = FakeBLEDevice()
+        self.client_options = client_options
+        self.clients: list[FakeMatsonClient] = []
+
+    @property
+    def client(self) -> FakeMatsonClient:
+        """Return the client of the latest connection."""
+        return self.clients[-1]
+
+    async def establish_connection(
+        self, client_class, device, name, disconnected_callback=None, **kwargs
+    ) -> FakeMatsonClient:
+        client = FakeMatsonClient(
+            self.device, disconnected_callback=disconnected_callback, **self.client_options
+        )
+        await client.connect()
+        self.clients.append(client)
+        return client
+
+    def coordinator(self, **options: Any) -> MatsonDataUpdateCoordinator:
+        entry = MagicMock()
+        # The simulated device does not notify on subscribe, keep the
+        # post-binding wait short
+        entry.data = {CONF_BINDING: {"settle": 0.01}}
+        entry.options = options
+        entry.entry_id = "test"
+        entry.unique_id = self.device.address
+        entry.title = "Matson Monitor"
+        return MatsonDataUpdateCoordinator(self.hass, entry, self.device, MatsonScheduler())
+
+
+@asynccontextmanager
+async def harness(**client_options: Any) -> AsyncIterator[Harness]:
+    """Run a Home Assistant instance with connects going to simulated clients."""
+    hass = HomeAssistant(tempfile.mkdtemp())
+    hass.config_entries = MagicMock()
+    await dr.async_load(hass)
+    bench = Harness(hass, client_options)
+    bluetooth = coordinator_module.bluetooth
+    try:
+        with (
+            patch.object(coordinator_module, "establish_connection", bench.establish_connection),
+            patch.object(bluetooth, "async_ble_device_from_address", return_value=None),
+            patch.object(bluetooth, "async_last_service_info", return_value=None),
+        ):
+            yield bench
+    finally:
+        await hass.async_stop(force=True)
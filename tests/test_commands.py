@@ -0,0 +1,49 @@
+"""Tests for the command queue."""
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.matson_monitor.commands import CommandQueue
+
+UUID = "0000ffe2-0000-1000-8000-00805f9b34fb"
+
+
+def _drain(queue: CommandQueue) -> list:
+    commands = []
+    while (command := queue.pop()) is not None:
+        commands.append(command)
+    return commands
+
+
+def test_different_writes_are_all_sent_in_order() -> None:
+    async def scenario() -> None:
+        queue = CommandQueue()
+        loop = asyncio.get_running_loop()
+        futures = [queue.put(UUID, data, loop) for data in (b"\x01", b"\x02", b"\x02", b"\x01")]
+        commands = _drain(queue)
+        assert [command.data for command in commands] == [b"\x01", b"\x02", b"\x01"]
+        assert queue.merged == 1
+
+        commands[0].complete()
+        assert futures[0].done()
+        assert not any(future.done() for future in futures[1:])
+        commands[1].complete()
+        assert futures[1].done() and futures[2].done()
+        assert not futures[3].done()
+
+    asyncio.run(scenario())
+
+
+def test_fail_all_and_cancel_all() -> None:
+    async def scenario() -> None:
+        queue = CommandQueue()
+        loop = asyncio.get_running_loop()
+        failed = queue.put(UUID, b"\x01", loop)
+        queue.fail_all(RuntimeError("gone"))
+        assert isinstance(failed.exception(), RuntimeError)
+        cancelled = queue.put(UUID, b"\x01", loop)
+        queue.cancel_all()
+        assert cancelled.cancelled()
+        assert len(queue) == 0
+
+    asyncio.run(scenario())
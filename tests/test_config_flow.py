@@ -0,0 +1,144 @@
+"""Tests for the config and options flows."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.matson_monitor import config_flow
+from custom_components.matson_monitor.const import (
+    CONF_CONNECTION_POLICY,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONNECTION_POLICY_IDLE,
+    DATA_DISCOVERY,
+    DOMAIN,
+)
+from custom_components.matson_monitor.discovery import MatsonDiscoveryIndex
+
+
+@asynccontextmanager
+async def _hass(*advertisements: SimpleNamespace) -> AsyncIterator[HomeAssistant]:
+    """Run a Home Assistant instance whose discovery index holds these devices."""
+    hass = HomeAssistant(tempfile.mkdtemp())
+    hass.config_entries = MagicMock()
+    hass.config_entries.async_entries.return_value = []
+    hass.config_entries.async_entry_for_domain_unique_id.return_value = None
+    index = MatsonDiscoveryIndex()
+    for service_info in advertisements:
+        index.async_update(service_info)
+    hass.data[DOMAIN] = {DATA_DISCOVERY: index}
+    try:
+        yield hass
+    finally:
+        await hass.async_stop(force=True)
+
+
+def _advertisement(address: str, rssi: int) -> SimpleNamespace:
+    """Return the parts of a BluetoothServiceInfoBleak the index uses."""
+    return SimpleNamespace(
+        address=address, name="Matson Monitor", rssi=rssi, connectable=True, time=time.monotonic()
+    )
+
+
+def _flow(hass: HomeAssistant) -> config_flow.MatsonMonitorConfigFlow:
+    flow = config_flow.MatsonMonitorConfigFlow()
+    flow.hass = hass
+    flow.handler = DOMAIN
+    flow.flow_id = "flow"
+    flow.context = {"source": "user"}
+    return flow
+
+
+def _options_flow(options: dict) -> config_flow.MatsonMonitorOptionsFlow:
+    entry = MagicMock()
+    entry.options = options
+    return config_flow.MatsonMonitorOptionsFlow(entry)
+
+
+def test_user_step_offers_devices_strongest_first() -> None:
+    async def scenario() -> None:
+        weak = _advertisement("AA:BB:CC:DD:EE:01", -90)
+        strong = _advertisement("AA:BB:CC:DD:EE:02", -50)
+        async with _hass(weak, strong) as hass:
+            result = await _flow(hass).async_step_user()
+            assert result["type"] == FlowResultType.FORM
+            choices = result["data_schema"].schema[CONF_ADDRESS].options
+            assert list(choices) == [strong.address, weak.address]
+
+    asyncio.run(scenario())
+
+
+def test_user_step_onboards_the_rest_of_a_batch() -> None:
+    async def scenario() -> None:
+        first = _advertisement("AA:BB:CC:DD:EE:01", -50)
+        second = _advertisement("AA:BB:CC:DD:EE:02", -60)
+        async with _hass(first, second) as hass:
+            flow = _flow(hass)
+            await flow.async_step_user()
+            with patch.object(config_flow, "async_onboard") as onboard:
+                result = await flow.async_step_user(
+                    {CONF_ADDRESS: [first.address, second.address]}
+                )
+                await hass.async_block_till_done()
+            assert result["type"] == FlowResultType.CREATE_ENTRY
+            assert flow.unique_id == first.address
+            (_, devices), _ = onboard.call_args
+            assert [device.address for device in devices] == [second.address]
+
+    asyncio.run(scenario())
+
+
+def test_user_step_aborts_without_devices() -> None:
+    async def scenario() -> None:
+        async with _hass() as hass:
+            result = await _flow(hass).async_step_user()
+            assert result["type"] == FlowResultType.ABORT
+            assert result["reason"] == "no_devices_found"
+
+    asyncio.run(scenario())
+
+
+def test_options_reject_min_above_max() -> None:
+    async def scenario() -> None:
+        async with _hass() as hass:
+            flow = _options_flow({})
+            flow.hass = hass
+            result = await flow.async_step_init()
+            defaults = {
+                key.schema: key.default() for key in result["data_schema"].schema
+            }
+            result = await flow.async_step_init(
+                {**defaults, CONF_MIN_INTERVAL: 600, CONF_MAX_INTERVAL: 60}
+            )
+            assert result["type"] == FlowResultType.FORM
+            assert result["errors"] == {"base": "min_above_max"}
+
+            options = {**defaults, CONF_CONNECTION_POLICY: CONNECTION_POLICY_IDLE}
+            result = await flow.async_step_init(options)
+            assert result["type"] == FlowResultType.CREATE_ENTRY
+            assert result["data"] == options
+
+    asyncio.run(scenario())
+
+
+def test_options_default_to_current_values() -> None:
+    async def scenario() -> None:
+        async with _hass() as hass:
+            flow = _options_flow({CONF_MIN_INTERVAL: 42})
+            flow.hass = hass
+            result = await flow.async_step_init()
+            defaults = {
+                key.schema: key.default() for key in result["data_schema"].schema
+            }
+            assert defaults[CONF_MIN_INTERVAL] == 42
+
+    asyncio.run(scenario())
@@ -0,0 +1,296 @@
+"""Tests for the coordinator against the simulated device."""
+from __future__ import annotations
+
+import asyncio
+import os
+from unittest.mock import patch
+
+from conftest import harness
+from fake_matson import counter_frames
+
+from homeassistant.helpers import device_registry as dr
+
+from custom_components.matson_monitor import coordinator as coordinator_module
+from custom_components.matson_monitor.const import (
+    CONF_CONNECTION_POLICY,
+    CONF_IDLE_TIMEOUT,
+    CONF_PIPELINED_READS,
+    CONNECTION_POLICY_IDLE,
+    CONNECTION_POLICY_PER_POLL,
+    DOMAIN,
+    READ_PLAN_IDLE_INTERVAL,
+)
+from custom_components.matson_monitor.commands import Command
+from custom_components.matson_monitor.decoder import FrameDecoder
+from custom_components.matson_monitor.storage import cache_store
+
+BATTERY_LEVEL = "00002a19-0000-1000-8000-00805f9b34fb"
+MATSON_NOTIFY = "0000ffe1-0000-1000-8000-00805f9b34fb"
+MATSON_WRITE = "0000ffe2-0000-1000-8000-00805f9b34fb"
+
+
+def _age_reads(coordinator, seconds: float) -> None:
+    """Pretend every characteristic was last read this many seconds earlier."""
+    for uuid in coordinator._last_read:
+        coordinator._last_read[uuid] -= seconds
+
+
+def test_read_decodes_values_and_device_info() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            registry = dr.async_get(bench.hass)
+            device = registry.async_get_or_create(
+                config_entry_id="test", identifiers={(DOMAIN, bench.device.address)}
+            )
+
+            data = await coordinator._async_update_data()
+
+            assert data["battery_level"] == 0x57
+            assert data["data_00002a00"] == "MATSON Monitor"
+            assert data["data_0000ffe1"] == "\x01\x10\x05"
+            assert data["rssi"] == -60
+            assert coordinator.device_read
+            assert coordinator.device_info_fields == {
+                "model": "MM-100",
+                "serial_number": "SN000123",
+                "sw_version": "1.4.2",
+                "hw_version": "rev B",
+                "manufacturer": "Matson",
+            }
+            device = registry.async_get(device.id)
+            assert (device.model, device.serial_number, device.sw_version) == (
+                "MM-100",
+                "SN000123",
+                "1.4.2",
+            )
+
+            bench.client.set_value(BATTERY_LEVEL, b"\x50")
+            data = await coordinator._async_update_data()
+            assert data["battery_level"] == 0x50
+            assert "battery_level" in coordinator.changed_keys
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_flat_values_stay_in_the_read_plan() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            await coordinator._async_update_data()
+            # Enough idle-rate reads to see the value unchanged 20 times over
+            for _ in range(25):
+                _age_reads(coordinator, READ_PLAN_IDLE_INTERVAL)
+                await coordinator._read_data()
+            bench.client.set_value(BATTERY_LEVEL, b"\x10")
+            data = await coordinator._read_data()
+            assert data["battery_level"] == 0x57
+            _age_reads(coordinator, READ_PLAN_IDLE_INTERVAL)
+            data = await coordinator._read_data()
+            assert data["battery_level"] == 0x10
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_per_poll_does_not_reread_static_characteristics() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator(
+                **{CONF_CONNECTION_POLICY: CONNECTION_POLICY_PER_POLL}
+            )
+            for _ in range(8):
+                await coordinator._async_update_data()
+            reads = [client.reads for client in bench.clients]
+            # Every characteristic once, then only the dynamic ones until
+            # they have been flat long enough to drop to the idle rate, and
+            # no connection at all while nothing is due
+            assert reads == [9, 2, 2, 2, 2, 2]
+            _age_reads(coordinator, READ_PLAN_IDLE_INTERVAL)
+            await coordinator._async_update_data()
+            assert bench.client.reads == 2
+            assert len(bench.clients) == 7
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_idle_policy_releases_an_unused_link() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator(
+                **{CONF_CONNECTION_POLICY: CONNECTION_POLICY_IDLE, CONF_IDLE_TIMEOUT: 0.05}
+            )
+            await coordinator._async_update_data()
+            await asyncio.sleep(0.03)
+            # A write within the timeout reuses the link and keeps it open
+            await coordinator.async_write_data(MATSON_WRITE, b"\x01")
+            await asyncio.sleep(0.03)
+            assert bench.client.is_connected
+            assert len(bench.clients) == 1
+            await asyncio.sleep(0.05)
+            assert not bench.client.is_connected
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_pipelined_reads_survive_a_failing_characteristic() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator(**{CONF_PIPELINED_READS: True})
+            await coordinator._connect()
+            read = bench.client.read_gatt_char
+
+            async def read_gatt_char(specifier):
+                if bench.client._resolve(specifier).uuid == MATSON_NOTIFY:
+                    raise RuntimeError("Insufficient authentication")
+                return await read(specifier)
+
+            bench.client.read_gatt_char = read_gatt_char
+            await coordinator._read_data()
+            assert coordinator._pipelined
+            assert coordinator.stats.read_errors == 1
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_pipelined_reads_fall_back_when_overlap_is_rejected() -> None:
+    async def scenario() -> None:
+        async with harness(max_in_flight=1, read_latency=0.001) as bench:
+            coordinator = bench.coordinator(**{CONF_PIPELINED_READS: True})
+            data = await coordinator._async_update_data()
+            assert not coordinator._pipelined
+            assert coordinator.stats.read_errors == 0
+            assert data["battery_level"] == 0x57
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_notifications_decode_every_frame_per_type() -> None:
+    decoder = FrameDecoder(
+        {
+            (MATSON_NOTIFY, 1): (("counter", 1, "<H", 1, None), ("extra", 3, "<B", 1, None)),
+            (MATSON_NOTIFY, 2): (("temperature", 1, "<h", 0.1, "°C"),),
+        }
+    )
+
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            updates: list[dict] = []
+            coordinator.async_add_listener(lambda: updates.append(dict(coordinator.data)))
+            await coordinator._connect()
+
+            bench.client.notify(MATSON_NOTIFY, b"\x01\x05\x00\x07")
+            bench.client.notify(MATSON_NOTIFY, b"\x02\xd2\x00")
+            # Short type 1 frame, extra keeps its last value
+            bench.client.notify(MATSON_NOTIFY, b"\x01\x06\x00")
+            coordinator._flush_notifications()
+
+            assert updates[-1]["counter"] == 6
+            assert updates[-1]["extra"] == 7
+            assert updates[-1]["temperature"] == 21.0
+
+            bench.client.notify(MATSON_NOTIFY, b"\x02\xd3\x00")
+            coordinator._flush_notifications()
+            assert updates[-1]["counter"] == 6
+            assert updates[-1]["temperature"] == 21.1
+            assert coordinator.changed_keys == {"temperature"}
+            await coordinator.async_shutdown()
+
+    with patch.object(coordinator_module, "DECODER", decoder):
+        asyncio.run(scenario())
+
+
+def test_notification_burst_is_decoded_frame_by_frame() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            seen: list[int] = []
+            store_frame = coordinator._store_frame
+
+            def record(uuid: str, value: bytes) -> None:
+                seen.append(int.from_bytes(value[1:3], "little"))
+                store_frame(uuid, value)
+
+            coordinator._store_frame = record
+            await coordinator._connect()
+            await bench.client.stream(MATSON_NOTIFY, counter_frames(10))
+            coordinator._flush_notifications()
+            assert seen == list(range(10))
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_writes_are_sent_in_order() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            futures = [
+                coordinator.async_enqueue_write(MATSON_WRITE, data)
+                for data in (b"\x01", b"\x02", b"\x02", b"\x03")
+            ]
+            await asyncio.gather(*futures)
+            assert [data for _, data, _ in bench.client.writes] == [b"\x01", b"\x02", b"\x03"]
+            # The write characteristic offers write without response
+            assert not any(response for _, _, response in bench.client.writes)
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_write_after_link_loss_is_a_bleak_error() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            await coordinator._connect()
+            bench.client._drop(expected=False)
+            try:
+                await coordinator._write_command(Command(MATSON_WRITE, b"\x01"))
+            except coordinator_module.BleakError:
+                pass
+            else:
+                raise AssertionError("write without a link did not fail")
+            assert not bench.client.writes
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_backoff_is_not_a_failed_poll() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            coordinator._connection._schedule_retry()
+            interval = coordinator._poll_interval
+            try:
+                await coordinator._async_update_data()
+            except coordinator_module.UpdateFailed as err:
+                assert isinstance(err.__cause__, coordinator_module.ConnectBackoffError)
+            else:
+                raise AssertionError("poll during backoff did not fail")
+            assert coordinator._poll_interval == interval
+            assert not bench.clients
+
+    asyncio.run(scenario())
+
+
+def test_shutdown_writes_the_cache() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            coordinator.data = await coordinator._async_update_data()
+            await coordinator.async_shutdown()
+            # Written now, not left pending to recreate the file after
+            # async_remove_entry deleted it
+            store = cache_store(bench.hass, "test")
+            assert os.path.exists(store.path)
+            cached = await store.async_load()
+            assert cached["data"]["battery_level"] == 0x57
+
+    asyncio.run(scenario())
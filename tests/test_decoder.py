@@ -0,0 +1,49 @@
+"""Tests for the frame decoder."""
+from __future__ import annotations
+
+from custom_components.matson_monitor.decoder import FrameDecoder
+
+UUID = "0000ffe1-0000-1000-8000-00805f9b34fb"
+
+
+def test_scaled_fields_keep_the_scale_precision() -> None:
+    decoder = FrameDecoder(
+        {
+            UUID: (
+                ("quarter", 0, "<B", 0.25, None),
+                ("temperature", 1, "<h", 0.01, "°C"),
+                ("tens", 3, "<B", 10, None),
+            )
+        }
+    )
+    assert decoder.decode(UUID, bytes([3]) + (2155).to_bytes(2, "little") + bytes([7])) == {
+        "quarter": 0.75,
+        "temperature": 21.55,
+        "tens": 70,
+    }
+
+
+def test_short_frame_skips_missing_fields() -> None:
+    decoder = FrameDecoder({UUID: (("a", 0, "<B", 1, None), ("b", 1, "<H", 1, None))})
+    assert decoder.decode(UUID, b"\x05") == {"a": 5}
+
+
+def test_multiplexed_frame_types() -> None:
+    decoder = FrameDecoder(
+        {
+            (UUID, 1): (("voltage", 1, "<H", 0.01, "V"),),
+            (UUID, 2): (("current", 1, "<H", 0.01, "A"),),
+        }
+    )
+    assert decoder.decode(UUID, b"\x01\x10\x05") == {"voltage": 12.96}
+    assert decoder.decode(UUID, b"\x02\x20\x01") == {"current": 2.88}
+    assert decoder.decode(UUID, b"\x03\x00\x00") is None
+    assert decoder.frame_key(UUID, b"\x01\x10\x05") == (UUID, 1)
+    assert decoder.frame_key(UUID, b"\x03\x00\x00") == UUID
+    assert decoder.keys_by_uuid[UUID] == {"voltage", "current"}
+
+
+def test_unknown_characteristic() -> None:
+    decoder = FrameDecoder({})
+    assert not decoder.handles(UUID)
+    assert decoder.decode(UUID, b"\x01") is None
@@ -0,0 +1,49 @@
+"""Tests for notification reassembly."""
+from __future__ import annotations
+
+from custom_components.matson_monitor.framing import FrameAssembler, FramingSpec, NotifyChannel
+
+# 0xAA, payload length, payload, sum8 checksum
+LENGTH_PREFIXED = {"start": 0xAA, "length_offset": 1, "header": 2, "checksum": "sum8"}
+
+
+def _frame(payload: bytes) -> bytes:
+    body = bytes([0xAA, len(payload)]) + payload
+    return body + bytes([sum(body) & 0xFF])
+
+
+def test_fragments_join_into_frames() -> None:
+    assembler = FrameAssembler(FramingSpec.from_config(LENGTH_PREFIXED))
+    stream = _frame(b"\x01\x02\x03") + _frame(b"\x04")
+    assert assembler.feed(stream[:4]) == []
+    frames = [bytes(frame) for frame in assembler.feed(stream[4:])]
+    assert frames == [_frame(b"\x01\x02\x03"), _frame(b"\x04")]
+
+
+def test_bad_checksum_and_garbage_are_skipped() -> None:
+    assembler = FrameAssembler(FramingSpec.from_config(LENGTH_PREFIXED))
+    corrupt = bytearray(_frame(b"\x01"))
+    corrupt[-1] ^= 0xFF
+    frames = assembler.feed(b"\x00\x00" + bytes(corrupt) + _frame(b"\x02"))
+    assert [bytes(frame) for frame in frames] == [_frame(b"\x02")]
+    assert assembler.checksum_errors == 1
+
+
+def test_unread_returns_every_frame_since_the_last_call() -> None:
+    channel = NotifyChannel()
+    for value in (b"a", b"b", b"c"):
+        channel.feed(value, 0.0)
+    assert [bytes(frame) for frame in channel.unread()] == [b"a", b"b", b"c"]
+    assert list(channel.unread()) == []
+    channel.feed(b"d", 1.0)
+    assert [bytes(frame) for frame in channel.unread()] == [b"d"]
+
+
+def test_unread_counts_frames_the_ring_overwrote() -> None:
+    channel = NotifyChannel()
+    capacity = 32
+    for index in range(capacity + 5):
+        channel.feed(bytes([index]), 0.0)
+    frames = [bytes(frame)[0] for frame in channel.unread()]
+    assert frames == list(range(5, capacity + 5))
+    assert channel.dropped == 5
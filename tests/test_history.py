@@ -0,0 +1,49 @@
+"""Tests for the sample history."""
+from __future__ import annotations
+
+from custom_components.matson_monitor.history import DeviceHistory, SampleSeries
+
+
+def test_series_window_statistics() -> None:
+    series = SampleSeries(3)
+    for timestamp, value in enumerate((5.0, 1.0, 3.0, 4.0)):
+        series.append(float(timestamp), value)
+    assert len(series) == 3
+    assert series.minimum == 1.0
+    assert series.maximum == 4.0
+    assert series.mean == 8.0 / 3
+    assert series.rate == 1.5
+
+
+def test_flat_value_keeps_statistics_current() -> None:
+    history = DeviceHistory()
+    history.record(0.0, {"voltage": 10})
+    history.record(30.0, {"voltage": 20})
+    # Flat for two hours, longer than the raw window holds
+    for timestamp in range(60, 7200, 30):
+        history.record(float(timestamp), {"voltage": 20})
+    stats = history.statistics("voltage")
+    assert stats["min"] == 20.0
+    assert stats["mean"] == 20.0
+    assert stats["rate_per_minute"] == 0.0
+
+
+def test_buckets_close_on_time() -> None:
+    history = DeviceHistory()
+    history.record(0.0, {"voltage": 10, "name": "x"})
+    history.record(30.0, {"voltage": 20})
+    # No new voltage sample, but its buckets still close once time moves on
+    history.record(1000.0, {})
+    levels = history.fields["voltage"].levels
+    assert levels[60].samples() == [(0.0, 15.0)]
+    assert levels[900].samples() == [(0.0, 15.0)]
+    assert "name" not in history.fields
+
+
+def test_samples_are_taken_on_time() -> None:
+    history = DeviceHistory()
+    # A burst of advertisements adds one sample per sample interval
+    for step in range(100):
+        history.record(step * 0.5, {"voltage": step})
+    samples = history.fields["voltage"].raw.samples()
+    assert samples == [(0.0, 0.0), (30.0, 60.0)]
@@ -0,0 +1,65 @@
+"""Tests for the shared radio scheduler."""
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.matson_monitor.scheduler import MatsonScheduler, _AdapterQueue
+
+
+def test_stalest_device_goes_first() -> None:
+    async def scenario() -> list[str]:
+        scheduler = MatsonScheduler()
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def holder() -> None:
+            async with scheduler.async_radio_slot("hci0", "holder", None):
+                await release.wait()
+
+        async def waiter(address: str, last_success: float) -> None:
+            async with scheduler.async_radio_slot("hci0", address, last_success):
+                order.append(address)
+
+        task = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(waiter("fresh", 200.0)),
+            asyncio.create_task(waiter("stale", 100.0)),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(task, *waiters)
+        return order
+
+    assert asyncio.run(scenario()) == ["stale", "fresh"]
+
+
+def test_adapters_are_independent() -> None:
+    async def scenario() -> None:
+        scheduler = MatsonScheduler()
+        async with scheduler.async_radio_slot("hci0", "a", None):
+            await asyncio.wait_for(_enter(scheduler, "hci1"), 1)
+
+    async def _enter(scheduler: MatsonScheduler, adapter: str) -> None:
+        async with scheduler.async_radio_slot(adapter, "b", None):
+            pass
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_popped_by_release() -> None:
+    async def scenario() -> None:
+        queue = _AdapterQueue(1)
+        await queue.acquire(0)
+        waiter = asyncio.create_task(queue.acquire(1))
+        await asyncio.sleep(0)
+        # release() pops the cancelled future before the waiter handles it
+        waiter.cancel()
+        queue.release()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            pass
+        await asyncio.wait_for(queue.acquire(2), 1)
+
+    asyncio.run(scenario())
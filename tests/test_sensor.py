@@ -0,0 +1,144 @@
+"""Tests for the sensor platform against the simulated device."""
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+from conftest import harness
+
+from custom_components.matson_monitor.const import DOMAIN, HISTORY_SAMPLE_INTERVAL
+from custom_components.matson_monitor.sensor import (
+    SENSORS,
+    MatsonSensorEntity,
+    _dynamic_description,
+    async_setup_entry,
+)
+
+BATTERY_LEVEL = "00002a19-0000-1000-8000-00805f9b34fb"
+
+
+def _entry() -> MagicMock:
+    entry = MagicMock()
+    entry.entry_id = "test"
+    entry.unique_id = "AA:BB:CC:DD:EE:FF"
+    entry.title = "Matson Monitor"
+    return entry
+
+
+def _sensor(coordinator, key: str) -> tuple[MatsonSensorEntity, MagicMock]:
+    """Return a sensor for a data key and a mock recording its state writes."""
+    description = next(
+        (description for description in SENSORS if description.key == key),
+        None,
+    ) or _dynamic_description(key)
+    entity = MatsonSensorEntity(coordinator, _entry(), description)
+    write = MagicMock()
+    entity.async_write_ha_state = write
+    return entity, write
+
+
+def test_change_is_written_after_a_later_snapshot() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            await coordinator._async_update_data()
+            entity, write = _sensor(coordinator, "battery_level")
+            entity._handle_coordinator_update()
+            assert write.call_count == 1
+
+            bench.client.set_value(BATTERY_LEVEL, b"\x50")
+            coordinator.data = await coordinator._async_update_data()
+            # An advertisement rebuilds the snapshot before listeners run
+            coordinator._build_snapshot()
+            assert "battery_level" not in coordinator.changed_keys
+            entity._handle_coordinator_update()
+            assert write.call_count == 2
+            assert entity._written_value == 0x50
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_flat_value_writes_new_statistics() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            data = coordinator.data = await coordinator._async_update_data()
+            entity, write = _sensor(coordinator, "battery_level")
+            entity._handle_coordinator_update()
+            entity._handle_coordinator_update()
+            assert write.call_count == 1
+
+            # Same value, but a new sample moves the statistics
+            coordinator.history.record(time.time() + HISTORY_SAMPLE_INTERVAL, data)
+            entity._handle_coordinator_update()
+            assert write.call_count == 2
+            assert entity.extra_state_attributes["mean"] == 0x57
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_changes_within_the_deadband_are_not_written() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            coordinator.data = await coordinator._async_update_data()
+            entity, write = _sensor(coordinator, "rssi")
+            entity._handle_coordinator_update()
+            assert write.call_count == 1
+
+            coordinator._rssi = -62
+            coordinator._build_snapshot()
+            entity._handle_coordinator_update()
+            assert write.call_count == 1
+            coordinator._rssi = -63
+            coordinator._build_snapshot()
+            entity._handle_coordinator_update()
+            assert write.call_count == 2
+            assert entity._written_value == -63
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_cached_value_is_shown_until_the_device_is_read() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            coordinator.restored_data = {"battery_level": 80}
+            entity, _ = _sensor(coordinator, "battery_level")
+            entity.hass = bench.hass
+            await entity.async_added_to_hass()
+            assert entity.available
+            assert entity.native_value == 80
+
+            coordinator.data = await coordinator._async_update_data()
+            assert entity.native_value == 0x57
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_keys_seen_after_setup_get_sensors() -> None:
+    async def scenario() -> None:
+        async with harness() as bench:
+            coordinator = bench.coordinator()
+            coordinator.known_keys.add("battery_level")
+            bench.hass.data[DOMAIN] = {"test": coordinator}
+            added: list[str] = []
+
+            def add_entities(entities) -> None:
+                added.extend(entity.entity_description.key for entity in entities)
+
+            await async_setup_entry(bench.hass, _entry(), add_entities)
+            assert "battery_level" in added
+            assert "data_00002a00" not in added
+
+            coordinator.async_set_updated_data(await coordinator._async_update_data())
+            assert "data_00002a00" in added
+            assert added.count("battery_level") == 1
+            await coordinator.async_shutdown()
+
+    asyncio.run(scenario())
@@ -0,0 +1,35 @@
+"""Tests for the slot-based snapshot."""
+from __future__ import annotations
+
+from custom_components.matson_monitor.snapshot import MatsonSnapshot
+
+
+def _parse(snapshot: MatsonSnapshot, values: dict) -> set[str]:
+    snapshot.begin()
+    for key, value in values.items():
+        snapshot.put(key, value)
+    return snapshot.finish()
+
+
+def test_changed_keys_and_slots() -> None:
+    snapshot = MatsonSnapshot()
+    slot = snapshot.slot("temperature")
+    assert snapshot.value_at(slot) is None
+
+    assert _parse(snapshot, {"temperature": 21.5, "battery_level": 80}) == {
+        "temperature",
+        "battery_level",
+    }
+    assert _parse(snapshot, {"temperature": 21.5, "battery_level": 79}) == {"battery_level"}
+    assert snapshot.slot("temperature") == slot
+    assert snapshot.value_at(slot) == 21.5
+    assert dict(snapshot) == {"temperature": 21.5, "battery_level": 79}
+
+
+def test_keys_missing_from_a_parse_are_cleared() -> None:
+    snapshot = MatsonSnapshot()
+    _parse(snapshot, {"temperature": 21.5, "battery_level": 80})
+    assert _parse(snapshot, {"temperature": 21.5}) == {"battery_level"}
+    assert "battery_level" not in snapshot
+    assert len(snapshot) == 1
+    assert snapshot.value_at(snapshot.slot("battery_level")) is None